@@ -0,0 +1,90 @@
+"""
+Moduł implementujący sąsiedztwo grafu indeksowane gęstymi indeksami wierzchołków.
+
+Algorytmy przechowują stan w strukturach indeksowanych numerem wierzchołka
+(zob. NodeStore). Przeglądanie sąsiadów przez ``graph.neighbors(node_id)``
+wymaga jednak przy każdej relaksacji zamiany indeksu na identyfikator
+i z powrotem. Sąsiedztwo indeksowe przechowuje dla wierzchołka listę par
+``(indeks sąsiada, atrybuty krawędzi)``, więc pętla relaksacji nie wykonuje
+tych zamian. Wagi nie są kopiowane - algorytmy odczytują je ze słownika
+atrybutów w chwili relaksacji, więc zmiana atrybutu w miejscu jest od razu
+widoczna, a jedno sąsiedztwo obsługuje wszystkie atrybuty wag.
+
+Listy wyliczane są leniwie, tylko dla wierzchołków odwiedzanych przez
+algorytmy. Graph i graph_UI.Graph przechowują je między zapytaniami
+i przy każdej zmianie unieważniają jedynie listy zmienionych wierzchołków,
+więc koszt zapytania po zmianie nadal zależy od przeszukanego obszaru.
+Dla innych grafów (np. GraphView) listy żyją tylko w trakcie jednego zapytania.
+
+Example:
+    >>> adjacency = index_adjacency(graph)
+    >>> for neighbor_index, attributes in adjacency[graph.nodes.index("WAW")]:
+    ...     print(graph.nodes.node_id(neighbor_index), attributes["distance"])
+"""
+
+from typing import Any, Dict, List, Tuple
+
+Edge = Tuple[int, Dict[str, Any]]
+
+
+class IndexAdjacency(dict):
+    """
+    Sąsiedztwo indeksowe wyliczane na żądanie dla odwiedzanych wierzchołków.
+
+    Klucze to indeksy wierzchołków, a wartości listy par
+    ``(indeks sąsiada, atrybuty krawędzi)``. Krawędzie do wierzchołków spoza
+    grafu są pomijane; listy zawierające takie krawędzie nie są zapamiętywane,
+    aby późniejsze dodanie brakującego wierzchołka było od razu widoczne.
+    """
+
+    def __init__(self, graph):
+        """
+        Inicjalizuje puste sąsiedztwo.
+
+        Args:
+            graph: Graf udostępniający ``nodes`` (NodeStore) i ``neighbors(node_id)``.
+        """
+        super().__init__()
+        self._graph = graph
+
+    def __missing__(self, index: int) -> List[Edge]:
+        nodes = self._graph.nodes
+        node_index = nodes.index
+        edges = []
+        complete = True
+        for neighbor, attributes in self._graph.neighbors(nodes.node_id(index)):
+            try:
+                edges.append((node_index(neighbor), attributes))
+            except KeyError:
+                complete = False
+        if complete:
+            self[index] = edges
+        return edges
+
+    def discard(self, node_id) -> None:
+        """
+        Unieważnia zapamiętaną listę krawędzi wychodzących wierzchołka.
+
+        Args:
+            node_id: Identyfikator wierzchołka (nieistniejący jest ignorowany).
+        """
+        if self and node_id in self._graph.nodes:
+            self.pop(self._graph.nodes.index(node_id), None)
+
+
+def index_adjacency(graph) -> IndexAdjacency:
+    """
+    Zwraca sąsiedztwo indeksowe grafu.
+
+    Args:
+        graph: Graf udostępniający ``nodes`` i ``neighbors(node_id)``; jeśli ma
+            metodę ``index_adjacency``, używane jest sąsiedztwo przechowywane
+            przez graf.
+
+    Returns:
+        IndexAdjacency: Sąsiedztwo indeksowane indeksem wierzchołka.
+    """
+    stored = getattr(graph, "index_adjacency", None)
+    if stored is not None:
+        return stored()
+    return IndexAdjacency(graph)
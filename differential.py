@@ -0,0 +1,382 @@
+"""
+Moduł do testów różnicowych algorytmów najkrótszej ścieżki.
+
+Ten moduł generuje losowe grafy o różnych rozmiarach i kształtach, a następnie
+porównuje wyniki wszystkich implementacji wyszukiwania (na wszystkich
+dostępnych reprezentacjach grafu) z wynikiem referencyjnym wyznaczonym
+algorytmem Bellmana-Forda oraz - jeśli jest zainstalowana - z biblioteką
+networkx. Dla każdego przypadku mierzony jest czas przygotowania i zapytań
+każdej implementacji, dzięki czemu jednocześnie wykrywane są błędy
+poprawności i spadki wydajności.
+
+Example:
+    >>> results = run_differential(sizes=(10, 50), seed=1)
+    >>> [result for result in results if result.mismatches]
+    []
+    >>> results[0].timings["dijkstra/graph"]
+    0.0012
+
+Attributes:
+    SHAPES (tuple): Dostępne kształty generowanych grafów.
+    IMPLEMENTATIONS (dict): Implementacje porównywane z wynikiem referencyjnym.
+    BACKENDS (dict): Reprezentacje grafu, na których uruchamiane są implementacje.
+"""
+
+import importlib.util
+import random
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from graph import Graph
+from graph_view import GraphView
+from landmarks import alt_search, build_landmarks
+from partition import partition_graph
+from shortest_path import INF, dijkstra, edge_weight, shortest_path_tree
+
+SHAPES = ("random", "grid", "chain", "sparse")
+
+
+def random_graph(node_count: int, shape: str = "random", seed: int = 0) -> Graph:
+    """
+    Generuje losowy graf skierowany o zadanym kształcie.
+
+    Identyfikatory wierzchołków są liczbami całkowitymi od 0, a krawędzie
+    mają całkowite wagi ``distance`` i ``time`` (również zerowe).
+
+    Args:
+        node_count (int): Liczba wierzchołków.
+        shape (str, optional): Kształt grafu: "random" (ok. 3 krawędzie na wierzchołek),
+            "grid" (siatka z krawędziami w obu kierunkach), "chain" (ścieżka z krawędziami
+            powrotnymi) lub "sparse" (wiele par bez ścieżki).
+        seed (int, optional): Ziarno generatora liczb losowych.
+
+    Returns:
+        Graph: Wygenerowany graf.
+
+    Raises:
+        ValueError: Gdy kształt jest nieznany.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown graph shape: {shape}")
+    rng = random.Random(seed)
+    graph = Graph()
+    for node in range(node_count):
+        graph.add_node(node, "bus_stop", f"Przystanek {node}")
+
+    def connect(a, b):
+        if a != b:
+            graph.add_edge(a, b, distance=rng.randint(0, 20), time=rng.randint(1, 20))
+
+    if shape == "random":
+        for _ in range(3 * node_count):
+            connect(rng.randrange(node_count), rng.randrange(node_count))
+    elif shape == "grid":
+        side = max(1, int(node_count ** 0.5))
+        for node in range(node_count):
+            for neighbor in (node + 1, node + side):
+                if neighbor < node_count and (neighbor == node + side or neighbor % side):
+                    connect(node, neighbor)
+                    connect(neighbor, node)
+    elif shape == "chain":
+        for node in range(node_count - 1):
+            connect(node, node + 1)
+        for _ in range(node_count // 3):
+            a = rng.randrange(node_count)
+            connect(a, rng.randrange(a + 1))
+    else:
+        for _ in range(node_count // 2):
+            connect(rng.randrange(node_count), rng.randrange(node_count))
+    return graph
+
+
+def reference_distances(graph: Graph, start, weight: str = "distance") -> Dict:
+    """
+    Wyznacza odległości algorytmem Bellmana-Forda (niezależnym od badanych implementacji).
+
+    Args:
+        graph (Graph): Graf bazowy.
+        start: Wierzchołek początkowy.
+        weight (str, optional): Atrybut krawędzi używany jako waga.
+
+    Returns:
+        Dict: Odległości do osiągalnych wierzchołków.
+    """
+    edges = [
+        (from_node, to_node, edge_weight(attributes, weight))
+        for from_node, targets in graph.edges.items()
+        for to_node, attributes in targets.items()
+    ]
+    distances = {start: 0}
+    for _ in range(len(graph.nodes)):
+        changed = False
+        for from_node, to_node, cost in edges:
+            if from_node in distances and distances[from_node] + cost < distances.get(to_node, INF):
+                distances[to_node] = distances[from_node] + cost
+                changed = True
+        if not changed:
+            break
+    return distances
+
+
+def _prepare_dijkstra(graph):
+    return lambda start, end: dijkstra(graph, start, end)
+
+
+def _prepare_hop_limited(graph):
+    # Limit równy liczbie wierzchołków nie zmienia wyniku, ale uruchamia wariant z etykietami
+    max_hops = max(1, len(graph.nodes))
+    return lambda start, end: dijkstra(graph, start, end, max_hops=max_hops)
+
+
+def _prepare_tree(graph):
+    trees = {}
+
+    def query(start, end):
+        if start not in trees:
+            trees[start] = shortest_path_tree(graph, start)
+        result = trees[start].paths([end])[0]
+        return result.cost, result.node_ids()
+    return query
+
+
+def _prepare_alt(graph):
+    table = build_landmarks(graph, count=4)
+    return lambda start, end: alt_search(graph, start, end, table)
+
+
+def _prepare_partition(graph):
+    partition = partition_graph(graph, cell_size=max(2, len(graph.nodes) // 4))
+    return partition.query
+
+
+IMPLEMENTATIONS = {
+    "dijkstra": _prepare_dijkstra,
+    "dijkstra_max_hops": _prepare_hop_limited,
+    "shortest_path_tree": _prepare_tree,
+    "alt": _prepare_alt,
+    "partition": _prepare_partition,
+}
+
+
+def _as_graph_ui(graph: Graph):
+    """Kopiuje graf do reprezentacji graph_UI.Graph (listy krawędzi)."""
+    from graph_UI import Graph as ListGraph
+
+    copy = ListGraph()
+    for node in graph.nodes:
+        copy.add_node(node, graph.nodes.type_of(node), graph.nodes.name_of(node))
+    for from_node, targets in graph.edges.items():
+        for to_node, attributes in targets.items():
+            copy.add_edge(from_node, to_node, **attributes)
+    return copy
+
+
+BACKENDS = {
+    "graph": lambda graph: graph,
+    "view": lambda graph: GraphView(graph),
+    "graph_ui": _as_graph_ui,
+}
+
+
+def _networkx_query(graph: Graph) -> Optional[Callable]:
+    """
+    Przygotowuje zapytania networkx, jeśli biblioteka jest zainstalowana.
+
+    Args:
+        graph (Graph): Graf bazowy.
+
+    Returns:
+        Optional[Callable]: Funkcja ``(start, end) -> (odległość, ścieżka)`` lub None.
+    """
+    try:
+        import networkx as nx
+    except ImportError:
+        return None
+    nx_graph = nx.DiGraph()
+    nx_graph.add_nodes_from(graph.nodes)
+    for from_node, targets in graph.edges.items():
+        for to_node, attributes in targets.items():
+            nx_graph.add_edge(from_node, to_node, distance=attributes["distance"])
+
+    def query(start, end):
+        try:
+            distance, path = nx.single_source_dijkstra(nx_graph, start, end, weight="distance")
+        except nx.NetworkXNoPath:
+            return INF, []
+        return distance, path
+    return query
+
+
+class CaseResult:
+    """
+    Wynik jednego przypadku testu różnicowego.
+
+    Attributes:
+        shape (str): Kształt grafu.
+        size (int): Liczba wierzchołków.
+        seed (int): Ziarno generatora.
+        timings (Dict[str, float]): Łączny czas (przygotowanie + zapytania)
+            w sekundach dla każdej pary ``implementacja/reprezentacja``.
+        mismatches (list): Niezgodności jako krotki
+            (implementacja, start, koniec, oczekiwana odległość, wynik).
+        skipped (list): Pominięte reprezentacje lub implementacje wraz z przyczyną.
+    """
+
+    def __init__(self, shape: str, size: int, seed: int):
+        """
+        Inicjalizuje pusty wynik przypadku.
+
+        Args:
+            shape (str): Kształt grafu.
+            size (int): Liczba wierzchołków.
+            seed (int): Ziarno generatora.
+        """
+        self.shape = shape
+        self.size = size
+        self.seed = seed
+        self.timings = {}
+        self.mismatches = []
+        self.skipped = []
+
+    def __repr__(self) -> str:
+        return (f"CaseResult(shape={self.shape!r}, size={self.size}, seed={self.seed}, "
+                f"mismatches={len(self.mismatches)})")
+
+
+def _check(graph: Graph, path: List, start, end, expected: float, distance: float) -> bool:
+    """
+    Sprawdza wynik zapytania względem odległości referencyjnej.
+
+    Oprócz odległości weryfikowane jest, czy ścieżka zaczyna się w start,
+    kończy w end, składa się z istniejących krawędzi i ma podaną długość.
+    """
+    if distance != expected:
+        return False
+    if expected == INF:
+        return path == []
+    if not path or path[0] != start or path[-1] != end:
+        return False
+    cost = 0
+    for from_node, to_node in zip(path, path[1:]):
+        attributes = graph.edges.get(from_node, {}).get(to_node)
+        if attributes is None:
+            return False
+        cost += edge_weight(attributes, "distance")
+    return cost == distance
+
+
+def run_case(graph: Graph, pairs: Iterable[Tuple], result: CaseResult,
+             implementations: Optional[Dict[str, Callable]] = None,
+             backends: Optional[Dict[str, Callable]] = None) -> CaseResult:
+    """
+    Uruchamia wszystkie implementacje na wszystkich reprezentacjach dla podanych par.
+
+    Args:
+        graph (Graph): Graf bazowy.
+        pairs (Iterable[Tuple]): Pary (start, koniec) do sprawdzenia.
+        result (CaseResult): Wynik, do którego dopisywane są czasy i niezgodności.
+        implementations (Optional[Dict[str, Callable]]): Domyślnie ``IMPLEMENTATIONS``.
+        backends (Optional[Dict[str, Callable]]): Domyślnie ``BACKENDS``.
+
+    Returns:
+        CaseResult: Uzupełniony wynik przypadku.
+    """
+    implementations = implementations or IMPLEMENTATIONS
+    backends = backends or BACKENDS
+    pairs = list(pairs)
+    references = {}
+    for start, _ in pairs:
+        if start not in references:
+            references[start] = reference_distances(graph, start)
+
+    candidates = []
+    for backend_name, convert in backends.items():
+        try:
+            backend = convert(graph)
+        except ImportError as e:
+            result.skipped.append((backend_name, str(e)))
+            continue
+        for name, prepare in implementations.items():
+            candidates.append((f"{name}/{backend_name}", lambda prepare=prepare, backend=backend: prepare(backend)))
+    if importlib.util.find_spec("networkx") is not None:
+        candidates.append(("networkx", lambda: _networkx_query(graph)))
+    else:
+        result.skipped.append(("networkx", "not installed"))
+
+    for name, prepare in candidates:
+        started = time.perf_counter()
+        query = prepare()
+        for start, end in pairs:
+            expected = references[start].get(end, INF)
+            distance, path = query(start, end)
+            if not _check(graph, list(path), start, end, expected, distance):
+                result.mismatches.append((name, start, end, expected, distance))
+        result.timings[name] = time.perf_counter() - started
+    return result
+
+
+def slow_implementations(result: CaseResult, factor: float = 50.0,
+                         baseline: str = "dijkstra/graph",
+                         min_seconds: float = 0.005) -> List[Tuple[str, float]]:
+    """
+    Wskazuje implementacje wyraźnie wolniejsze od implementacji bazowej.
+
+    Czasy obejmują przygotowanie (np. budowę tablic ALT lub podziału), więc
+    współczynnik powinien być hojny - ma wykrywać zmiany złożoności, a nie
+    drobne wahania. Czasy krótsze niż ``min_seconds`` nie są porównywane,
+    bo przy nich dominuje szum pomiaru.
+
+    Args:
+        result (CaseResult): Wynik przypadku z uzupełnionymi czasami.
+        factor (float, optional): Dopuszczalna krotność czasu bazowego.
+        baseline (str, optional): Klucz czasu bazowego w ``result.timings``.
+        min_seconds (float, optional): Minimalny czas bazowy brany pod uwagę.
+
+    Returns:
+        List[Tuple[str, float]]: Pary (nazwa, krotność czasu bazowego) dla
+            implementacji przekraczających próg.
+    """
+    base = max(result.timings.get(baseline, 0.0), min_seconds)
+    return [
+        (name, seconds / base)
+        for name, seconds in result.timings.items()
+        if seconds > factor * base
+    ]
+
+
+def run_differential(sizes: Iterable[int] = (10, 100), shapes: Iterable[str] = SHAPES,
+                     seed: int = 0, queries: int = 20) -> List[CaseResult]:
+    """
+    Uruchamia test różnicowy dla wszystkich kombinacji rozmiarów i kształtów.
+
+    Args:
+        sizes (Iterable[int], optional): Liczby wierzchołków generowanych grafów.
+        shapes (Iterable[str], optional): Kształty generowanych grafów.
+        seed (int, optional): Ziarno generatora; każdy przypadek używa ziarna pochodnego.
+        queries (int, optional): Liczba losowych par (start, koniec) na przypadek.
+
+    Returns:
+        List[CaseResult]: Wyniki wszystkich przypadków.
+    """
+    results = []
+    for size in sizes:
+        for shape in shapes:
+            case_seed = seed * 1000003 + size * 31 + SHAPES.index(shape)
+            graph = random_graph(size, shape, case_seed)
+            rng = random.Random(case_seed)
+            pairs = [(rng.randrange(size), rng.randrange(size)) for _ in range(queries)]
+            results.append(run_case(graph, pairs, CaseResult(shape, size, case_seed)))
+    return results
+
+
+if __name__ == "__main__":
+    for case in run_differential():
+        print(case)
+        for name, seconds in sorted(case.timings.items(), key=lambda item: item[1]):
+            print(f"  {name:<36} {seconds:.4f} s")
+        for name, ratio in slow_implementations(case):
+            print(f"  SLOW {name}: {ratio:.1f}x dijkstra/graph")
+        for mismatch in case.mismatches:
+            print("  MISMATCH", mismatch)
+        for name, reason in case.skipped:
+            print(f"  skipped {name}: {reason}")
@@ -11,23 +11,30 @@ Example:
     >>> graph.add_edge(1, 2, distance=300)
 """
 
+from adjacency import IndexAdjacency
+from node_store import NodeStore
+
 class Graph:
     """
     Klasa reprezentująca graf.
 
     Attributes:
-        nodes (dict): Słownik wierzchołków grafu.
+        nodes (NodeStore): Kolumnowy magazyn wierzchołków grafu (interfejs słownika).
         edges (dict): Słownik krawędzi grafu.
+        coordinates (dict): Opcjonalne współrzędne (x, y) wierzchołków.
     """
 
     def __init__(self):
         """
         Inicjalizuje pusty graf.
         """
-        self.nodes = {}
+        self.nodes = NodeStore()
         self.edges = {}
+        self.coordinates = {}
+        self._adjacency = IndexAdjacency(self)
+        self._adjacency_source = (self.nodes, self.edges)
 
-    def add_node(self, node_id, node_type, name):
+    def add_node(self, node_id, node_type, name, coords=None):
         """
         Dodaje nowy wierzchołek do grafu.
 
@@ -35,8 +42,13 @@ class Graph:
             node_id: Unikalny identyfikator wierzchołka.
             node_type (str): Typ wierzchołka.
             name (str): Nazwa wierzchołka.
+            coords (tuple, optional): Współrzędne (x, y) wierzchołka.
         """
-        self.nodes[node_id] = {"type": node_type, "name": name}
+        self.nodes.add(node_id, node_type, name)
+        if coords is not None:
+            self.coordinates[node_id] = (float(coords[0]), float(coords[1]))
+        else:
+            self.coordinates.pop(node_id, None)
 
     def add_edge(self, from_node, to_node, **kwargs):
         """
@@ -53,6 +65,7 @@ class Graph:
         if from_node not in self.edges:
             self.edges[from_node] = {}
         self.edges[from_node][to_node] = kwargs
+        self._adjacency.discard(from_node)
 
     def remove_node(self, node_id):
         """
@@ -66,13 +79,16 @@ class Graph:
         """
         if node_id not in self.nodes:
             raise ValueError(f"Node with ID {node_id} does not exist.")
+        self._adjacency.discard(node_id)
         del self.nodes[node_id]
+        self.coordinates.pop(node_id, None)
         # Usuń krawędzie wychodzące z usuwanego węzła
         self.edges.pop(node_id, None)
         # Usuń krawędzie prowadzące do usuwanego węzła
         for from_node in list(self.edges.keys()):
             if node_id in self.edges[from_node]:
                 del self.edges[from_node][node_id]
+                self._adjacency.discard(from_node)
 
     def remove_edge(self, from_node, to_node):
         """
@@ -84,6 +100,37 @@ class Graph:
         """
         if from_node in self.edges and to_node in self.edges[from_node]:
             del self.edges[from_node][to_node]
+            self._adjacency.discard(from_node)
+
+    def neighbors(self, node_id):
+        """
+        Zwraca sąsiadów wierzchołka wraz z atrybutami krawędzi.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            Iterable: Pary (identyfikator sąsiada, słownik atrybutów krawędzi).
+        """
+        return self.edges.get(node_id, {}).items()
+
+    def index_adjacency(self):
+        """
+        Zwraca sąsiedztwo indeksowe grafu (zob. moduł adjacency).
+
+        Listy krawędzi wyliczane są dla wierzchołków odwiedzanych przez
+        algorytmy i zachowywane między zapytaniami. Metody zmieniające graf
+        unieważniają tylko listy zmienionych wierzchołków; podmiana ``nodes``
+        lub ``edges`` unieważnia całe sąsiedztwo.
+
+        Returns:
+            IndexAdjacency: Sąsiedztwo indeksowane indeksem wierzchołka.
+        """
+        source = self._adjacency_source
+        if source[0] is not self.nodes or source[1] is not self.edges:
+            self._adjacency = IndexAdjacency(self)
+            self._adjacency_source = (self.nodes, self.edges)
+        return self._adjacency
 
     def __str__(self):
         """
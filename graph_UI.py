@@ -1,28 +1,47 @@
 import tkinter as tk
 from tkinter import messagebox
-import json
 import matplotlib.pyplot as plt
 import networkx as nx
+from graph_journal import GraphJournal, apply_change
+from spatial_index import build_spatial_index
+from node_store import NodeStore
+from adjacency import IndexAdjacency
 
 class Graph:
     def __init__(self):
-        self.nodes = {}  # Węzły
+        self.nodes = NodeStore()  # Węzły (kolumnowo, z internowanymi typami i nazwami)
         self.edges = {}  # Krawędzie
+        self.coordinates = {}  # Opcjonalne współrzędne (x, y) węzłów
+        self._changes = []  # Zmiany od ostatniego zapisu
+        self._journal = None  # Dziennik pliku, z którym graf jest zsynchronizowany
+        self._adjacency = IndexAdjacency(self)  # Sąsiedztwo indeksowe odwiedzanych węzłów
+        self._adjacency_source = (self.nodes, self.edges)
 
-    def add_node(self, node_id, node_type, name):
+    def add_node(self, node_id, node_type, name, coords=None):
         """Dodanie węzła do grafu."""
         if node_id in self.nodes:
             raise ValueError(f"Node with ID {node_id} already exists.")
-        self.nodes[node_id] = {"type": node_type, "name": name}
+        self.nodes.add(node_id, node_type, name)
+        if coords is not None:
+            self.coordinates[node_id] = (float(coords[0]), float(coords[1]))
+            self._changes.append(["add_node", node_id, node_type, name, list(self.coordinates[node_id])])
+        else:
+            self._changes.append(["add_node", node_id, node_type, name])
 
     def remove_node(self, node_id):
         """Usunięcie węzła z grafu."""
         if node_id not in self.nodes:
             raise ValueError(f"Node with ID {node_id} does not exist.")
+        self._adjacency.discard(node_id)
         del self.nodes[node_id]
+        self.coordinates.pop(node_id, None)
         self.edges.pop(node_id, None)
         for key in self.edges:
-            self.edges[key] = [edge for edge in self.edges[key] if edge["to"] != node_id]
+            remaining = [edge for edge in self.edges[key] if edge["to"] != node_id]
+            if len(remaining) != len(self.edges[key]):
+                self.edges[key] = remaining
+                self._adjacency.discard(key)
+        self._changes.append(["remove_node", node_id])
 
     def add_edge(self, from_node, to_node, **attributes):
         """Dodanie krawędzi do grafu."""
@@ -31,11 +50,27 @@ class Graph:
         if from_node not in self.edges:
             self.edges[from_node] = []
         self.edges[from_node].append({"to": to_node, **attributes})
+        self._adjacency.discard(from_node)
+        self._changes.append(["add_edge", from_node, to_node, attributes])
 
     def remove_edge(self, from_node, to_node):
         """Usunięcie krawędzi z grafu."""
         if from_node in self.edges:
             self.edges[from_node] = [edge for edge in self.edges[from_node] if edge["to"] != to_node]
+            self._adjacency.discard(from_node)
+            self._changes.append(["remove_edge", from_node, to_node])
+
+    def neighbors(self, node_id):
+        """Zwraca pary (sąsiad, atrybuty krawędzi) dla węzła."""
+        return ((edge["to"], edge) for edge in self.edges.get(node_id, ()))
+
+    def index_adjacency(self):
+        """Zwraca sąsiedztwo indeksowe (zob. moduł adjacency); zmiany grafu unieważniają tylko listy zmienionych węzłów."""
+        source = self._adjacency_source
+        if source[0] is not self.nodes or source[1] is not self.edges:
+            self._adjacency = IndexAdjacency(self)
+            self._adjacency_source = (self.nodes, self.edges)
+        return self._adjacency
 
     def to_json(self):
         """Konwertuje graf do formatu JSON."""
@@ -43,6 +78,9 @@ class Graph:
             {"id": node_id, "type": node_data["type"], "name": node_data["name"]}
             for node_id, node_data in self.nodes.items()
         ]
+        for node in nodes:
+            if node["id"] in self.coordinates:
+                node["x"], node["y"] = self.coordinates[node["id"]]
         edges = [
             {"from": from_node, "to": edge["to"], "distance": edge.get("distance"), "time": edge.get("time")}
             for from_node, edges in self.edges.items()
@@ -51,42 +89,85 @@ class Graph:
         return {"nodes": nodes, "edges": edges}
 
     def save_to_file(self, filename):
-        """Zapisuje graf do pliku JSON."""
-        with open(filename, "w") as f:
-            json.dump(self.to_json(), f, indent=2)
+        """
+        Zapisuje graf do pliku JSON.
+
+        Jeśli graf jest zsynchronizowany z tym plikiem, do dziennika dopisywane są
+        tylko zmiany od ostatniego zapisu; pełna migawka zapisywana jest atomowo
+        przy pierwszym zapisie oraz po przekroczeniu progu kompaktowania.
+        """
+        if self._journal is None or self._journal.snapshot_path != filename:
+            self._journal = GraphJournal(filename)
+            self._journal.compact(self.to_json())
+        else:
+            self._journal.append(self._changes)
+            if self._journal.needs_compaction():
+                self._journal.compact(self.to_json())
+        self._changes = []
 
     def load_from_file(self, filename):
-        """Wczytuje graf z pliku JSON."""
-        with open(filename, "r") as f:
-            data = json.load(f)
-        self.nodes = {node["id"]: {"type": node["type"], "name": node["name"]} for node in data["nodes"]}
-        self.edges = {}
+        """
+        Wczytuje graf z pliku JSON, odtwarzając zmiany zapisane w dzienniku.
+
+        Stan grafu jest podmieniany dopiero po poprawnym wczytaniu całości.
+        Dla migawki bez identyfikatora dziennik jest pomijany, a pierwszy zapis
+        tworzy pełną migawkę.
+        """
+        journal = GraphJournal(filename)
+        data, changes = journal.load()
+        loaded = Graph()
+        for node in data["nodes"]:
+            loaded.nodes.add(node["id"], node["type"], node["name"])
+        loaded.coordinates = {node["id"]: (node["x"], node["y"]) for node in data["nodes"] if "x" in node and "y" in node}
         for edge in data["edges"]:
-            if edge["from"] not in self.edges:
-                self.edges[edge["from"]] = []
-            self.edges[edge["from"]].append({"to": edge["to"], "distance": edge.get("distance"), "time": edge.get("time")})
-
-def visualize_graph(graph, highlight_path=None):
+            if edge["from"] not in loaded.edges:
+                loaded.edges[edge["from"]] = []
+            loaded.edges[edge["from"]].append({"to": edge["to"], "distance": edge.get("distance"), "time": edge.get("time")})
+        for change in changes:
+            apply_change(loaded, change)
+        self.nodes = loaded.nodes
+        self.coordinates = loaded.coordinates
+        self.edges = loaded.edges
+        self._changes = []
+        self._journal = journal if journal.snapshot_id is not None else None
+
+def visualize_graph(graph, highlight_path=None, bbox=None, spatial_index=None):
     """
     Tworzy wizualizację grafu za pomocą matplotlib i networkx.
     
     Args:
         graph: Obiekt grafu do wizualizacji
         highlight_path: Lista węzłów tworzących ścieżkę do podświetlenia
+        bbox: Opcjonalny prostokąt (min_x, min_y, max_x, max_y) - rysowane są tylko
+            węzły o współrzędnych w jego wnętrzu
+        spatial_index: Opcjonalny, wcześniej zbudowany indeks przestrzenny grafu
     """
     plt.clf()  # Wyczyść poprzedni wykres
     G = nx.DiGraph()  # Używamy skierowanego grafu
 
+    # Przy zadanym obszarze rysujemy tylko węzły znalezione w indeksie przestrzennym
+    if bbox is not None:
+        if spatial_index is None:
+            spatial_index = build_spatial_index(graph)
+        visible = set(spatial_index.within_bbox(*bbox))
+    else:
+        visible = graph.nodes
+
     # Dodanie węzłów
-    for node_id, node_data in graph.nodes.items():
+    for node_id in visible:
+        node_data = graph.nodes[node_id]
         G.add_node(node_id, label=node_data["name"], type=node_data["type"])
 
     # Dodanie krawędzi
-    for from_node, edges in graph.edges.items():
-        for edge in edges:
-            G.add_edge(from_node, edge["to"], distance=edge.get("distance"), time=edge.get("time"))
+    for from_node in visible:
+        for edge in graph.edges.get(from_node, []):
+            if edge["to"] in visible:
+                G.add_edge(from_node, edge["to"], distance=edge.get("distance"), time=edge.get("time"))
 
-    pos = nx.spring_layout(G)  # Automatyczne rozmieszczenie węzłów
+    if G.nodes() and all(node in graph.coordinates for node in G.nodes()):
+        pos = {node: graph.coordinates[node] for node in G.nodes()}
+    else:
+        pos = nx.spring_layout(G)  # Automatyczne rozmieszczenie węzłów
     labels = nx.get_node_attributes(G, 'label')
 
     # Kolory węzłów
@@ -136,6 +217,7 @@ class GraphApp:
         self.graph = graph
         self.root = root
         self.root.title("Network Graph Analyzer")
+        self.spatial_index = None  # Budowany leniwie przy wyszukiwaniu po współrzędnych
         
         # Załaduj przykładowy graf jeśli istnieje
         try:
@@ -208,6 +290,10 @@ class GraphApp:
         self.node_name_entry = tk.Entry(node_frame)
         self.node_name_entry.pack(fill='x')
         
+        tk.Label(node_frame, text="Coordinates x,y (optional):").pack()
+        self.node_coords_entry = tk.Entry(node_frame)
+        self.node_coords_entry.pack(fill='x')
+        
         button_frame = tk.Frame(node_frame)
         button_frame.pack(fill='x', pady=5)
         tk.Button(button_frame, text="Add Node", command=self.add_node).pack(side='left', expand=True, padx=2)
@@ -242,11 +328,11 @@ class GraphApp:
         path_frame = tk.LabelFrame(left_frame, text="Find Shortest Path", padx=5, pady=5)
         path_frame.pack(fill='x', pady=(0, 10))
         
-        tk.Label(path_frame, text="Start Node:").pack()
+        tk.Label(path_frame, text="Start Node (ID or x,y):").pack()
         self.path_start_entry = tk.Entry(path_frame)
         self.path_start_entry.pack(fill='x')
         
-        tk.Label(path_frame, text="End Node:").pack()
+        tk.Label(path_frame, text="End Node (ID or x,y):").pack()
         self.path_end_entry = tk.Entry(path_frame)
         self.path_end_entry.pack(fill='x')
         
@@ -263,10 +349,14 @@ class GraphApp:
         operations_frame.pack(fill='x', pady=10)
         tk.Button(operations_frame, text="Save to JSON", command=self.save_to_json).pack(fill='x', pady=2)
         tk.Button(operations_frame, text="Load from JSON", command=self.load_from_json).pack(fill='x', pady=2)
+        tk.Label(operations_frame, text="Visible region min_x,min_y,max_x,max_y (optional):").pack()
+        self.view_bbox_entry = tk.Entry(operations_frame)
+        self.view_bbox_entry.pack(fill='x')
         tk.Button(operations_frame, text="Visualize Graph", command=self.visualize).pack(fill='x', pady=2)
 
     def update_lists(self):
         """Aktualizuje listy węzłów i krawędzi w interfejsie."""
+        self.spatial_index = None  # Graf mógł się zmienić
         # Aktualizacja listy węzłów
         self.nodes_list.delete(1.0, tk.END)
         if not self.graph.nodes:
@@ -291,11 +381,13 @@ class GraphApp:
             node_id = self.node_id_entry.get()
             node_type = self.node_type_entry.get()
             node_name = self.node_name_entry.get()
+            node_coords = self.node_coords_entry.get()
 
             if not node_id or not node_type or not node_name:
                 raise ValueError("All fields are required.")
 
-            self.graph.add_node(node_id, node_type, node_name)
+            coords = self.parse_numbers(node_coords, 2) if node_coords else None
+            self.graph.add_node(node_id, node_type, node_name, coords=coords)
             messagebox.showinfo("Success", f"Node {node_name} added successfully!")
             self.update_lists()  
         except ValueError as e:
@@ -358,6 +450,8 @@ class GraphApp:
             if not start or not end:
                 raise ValueError("Both start and end nodes are required.")
                 
+            start = self.resolve_node(start)
+            end = self.resolve_node(end)
             distance, path = dijkstra(self.graph, start, end)
             
             if not path:
@@ -366,7 +460,7 @@ class GraphApp:
                 return
                 
             self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, f"Distance: {distance}\nPath: {' -> '.join(path)}")
+            self.result_text.insert(tk.END, f"Distance: {distance}\nPath: {' -> '.join(map(str, path))}")
             
            
             self.visualize(highlight_path=path)
@@ -374,6 +468,26 @@ class GraphApp:
         except Exception as e:
             messagebox.showerror("Error", str(e))
             
+    def parse_numbers(self, text, count):
+        """Parsuje listę liczb rozdzieloną przecinkami."""
+        parts = text.split(",")
+        if len(parts) != count:
+            raise ValueError(f"Expected {count} comma-separated numbers.")
+        return tuple(float(part) for part in parts)
+
+    def resolve_node(self, text):
+        """Zamienia ID węzła lub współrzędne "x,y" na ID najbliższego węzła."""
+        if text in self.graph.nodes:
+            return text
+        try:
+            x, y = self.parse_numbers(text, 2)
+        except ValueError:
+            return text
+        if self.spatial_index is None:
+            self.spatial_index = build_spatial_index(self.graph)
+        nearest = self.spatial_index.nearest(x, y)
+        return nearest if nearest is not None else text
+
     def load_from_json(self):
         """Wczytuje graf z pliku JSON."""
         try:
@@ -391,7 +505,11 @@ class GraphApp:
     def visualize(self, highlight_path=None):
         """Wywołuje funkcję wizualizacji grafu."""
         try:
-            visualize_graph(self.graph, highlight_path)
+            view_bbox = self.view_bbox_entry.get()
+            bbox = self.parse_numbers(view_bbox, 4) if view_bbox else None
+            if bbox is not None and self.spatial_index is None:
+                self.spatial_index = build_spatial_index(self.graph)
+            visualize_graph(self.graph, highlight_path, bbox=bbox, spatial_index=self.spatial_index)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to visualize graph: {e}")
 
@@ -0,0 +1,260 @@
+"""
+Moduł odpowiedzialny za trwały, przyrostowy zapis grafu.
+
+Graf zapisywany jest jako para plików: migawka (snapshot) w formacie JSON
+oraz dziennik zmian (journal), do którego dopisywane są jedynie operacje
+wykonane od ostatniego zapisu. Dzięki temu koszt zapisu jest proporcjonalny
+do liczby zmian, a nie do rozmiaru grafu. Co pewną liczbę wpisów dziennik
+jest kompaktowany do nowej migawki.
+
+Migawka zapisywana jest atomowo (plik tymczasowy + ``os.replace``), więc
+przerwanie zapisu nigdy nie uszkadza poprzedniej wersji pliku. Każda
+migawka ma unikalny identyfikator, a dziennik zawiera w nagłówku
+identyfikator migawki, do której się odnosi - nieaktualny dziennik jest
+pomijany przy wczytywaniu. Niedokończony ostatni wpis dziennika (np. po
+awarii w trakcie dopisywania) jest odrzucany.
+
+Example:
+    >>> journal = GraphJournal("graph.json")
+    >>> journal.compact({"nodes": [], "edges": []})
+    >>> journal.append([["add_node", "A", "city", "Warszawa"]])
+    >>> data, changes = journal.load()
+
+Attributes:
+    JOURNAL_SUFFIX (str): Rozszerzenie dodawane do nazwy pliku migawki.
+    DEFAULT_COMPACT_THRESHOLD (int): Domyślna liczba wpisów dziennika,
+        po której następuje kompaktowanie.
+"""
+
+import json
+import os
+import tempfile
+import uuid
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+JOURNAL_SUFFIX = ".journal"
+DEFAULT_COMPACT_THRESHOLD = 1000
+
+
+def atomic_write(file_path: str, write: Callable[[TextIO], None]) -> None:
+    """
+    Atomowo zastępuje plik treścią zapisaną przez funkcję ``write``.
+
+    Dane trafiają najpierw do pliku tymczasowego w tym samym katalogu,
+    który po synchronizacji z dyskiem zastępuje plik docelowy.
+
+    Args:
+        file_path (str): Ścieżka do pliku docelowego.
+        write (Callable[[TextIO], None]): Funkcja zapisująca treść do otwartego pliku.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(file_path: str, data: Any, indent: Optional[int] = None) -> None:
+    """
+    Atomowo zapisuje dane JSON do pliku.
+
+    Args:
+        file_path (str): Ścieżka do pliku docelowego.
+        data (Any): Dane do zapisania.
+        indent (Optional[int]): Wcięcie przekazywane do ``json.dump``.
+    """
+    atomic_write(file_path, lambda f: json.dump(data, f, indent=indent, ensure_ascii=False))
+
+
+def apply_change(graph, change: List[Any]) -> None:
+    """
+    Odtwarza pojedynczą zmianę z dziennika na obiekcie grafu.
+
+    Args:
+        graph: Graf udostępniający metody add_node, remove_node,
+            add_edge i remove_edge.
+        change (List[Any]): Wpis dziennika w postaci ``[operacja, *argumenty]``.
+
+    Raises:
+        ValueError: Gdy operacja jest nieznana.
+    """
+    operation, args = change[0], change[1:]
+    if operation == "add_node":
+        graph.add_node(*args)
+    elif operation == "remove_node":
+        graph.remove_node(*args)
+    elif operation == "add_edge":
+        from_node, to_node, attributes = args
+        graph.add_edge(from_node, to_node, **attributes)
+    elif operation == "remove_edge":
+        graph.remove_edge(*args)
+    else:
+        raise ValueError(f"Unknown journal operation: {operation}")
+
+
+class GraphJournal:
+    """
+    Klasa zarządzająca migawką grafu i dziennikiem jego zmian.
+
+    Attributes:
+        snapshot_path (str): Ścieżka do pliku migawki.
+        journal_path (str): Ścieżka do pliku dziennika.
+        compact_threshold (int): Liczba wpisów, po której zalecane jest kompaktowanie.
+        snapshot_id (Optional[str]): Identyfikator bieżącej migawki.
+        entries (int): Liczba wpisów w dzienniku od ostatniego kompaktowania.
+    """
+
+    def __init__(self, snapshot_path: str, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        """
+        Inicjalizuje dziennik dla podanego pliku migawki.
+
+        Args:
+            snapshot_path (str): Ścieżka do pliku migawki.
+            compact_threshold (int): Liczba wpisów, po której zalecane jest kompaktowanie.
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + JOURNAL_SUFFIX
+        self.compact_threshold = compact_threshold
+        self.snapshot_id = None
+        self.entries = 0
+
+    def load(self) -> Tuple[Dict[str, Any], List[List[Any]]]:
+        """
+        Wczytuje migawkę oraz zmiany zapisane w dzienniku.
+
+        Nieaktualny dziennik lub niedokończony ostatni wpis są odrzucane,
+        a plik dziennika jest przepisywany tak, aby kolejne dopisywanie
+        zaczynało się od poprawnego stanu. Migawka bez identyfikatora
+        (np. zapisana ręcznie lub starszą wersją programu) nie ma dziennika -
+        ``snapshot_id`` pozostaje wtedy None, a przed dopisywaniem zmian
+        należy zapisać nową migawkę przez ``compact``.
+
+        Returns:
+            Tuple[Dict[str, Any], List[List[Any]]]: Dane migawki oraz lista
+                zmian do odtworzenia.
+
+        Raises:
+            FileNotFoundError: Gdy plik migawki nie istnieje.
+        """
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.snapshot_id = data.get("snapshot_id")
+        if self.snapshot_id is None:
+            self.entries = 0
+            return data, []
+
+        changes, clean = self._read_journal()
+        if not clean:
+            self._write_journal(changes)
+        self.entries = len(changes)
+        return data, changes
+
+    def read_changes(self, snapshot_id: Optional[str]) -> List[List[Any]]:
+        """
+        Odczytuje zmiany dziennika bez modyfikowania plików.
+
+        Args:
+            snapshot_id (Optional[str]): Identyfikator wczytanej migawki.
+
+        Returns:
+            List[List[Any]]: Poprawne wpisy dziennika należącego do tej migawki
+                (pusta lista dla migawki bez identyfikatora).
+        """
+        if snapshot_id is None:
+            return []
+        self.snapshot_id = snapshot_id
+        return self._read_journal()[0]
+
+    def append(self, changes: List[List[Any]]) -> None:
+        """
+        Dopisuje zmiany na końcu dziennika.
+
+        Args:
+            changes (List[List[Any]]): Lista wpisów do dopisania.
+        """
+        if not changes:
+            return
+        if not os.path.exists(self.journal_path):
+            self._write_journal([])
+        lines = "".join(json.dumps(change, ensure_ascii=False) + "\n" for change in changes)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries += len(changes)
+
+    def needs_compaction(self) -> bool:
+        """
+        Sprawdza, czy dziennik przekroczył próg kompaktowania.
+
+        Returns:
+            bool: True jeśli należy zapisać nową migawkę.
+        """
+        return self.entries >= self.compact_threshold
+
+    def compact(self, snapshot_data: Dict[str, Any]) -> None:
+        """
+        Zapisuje nową migawkę i rozpoczyna pusty dziennik.
+
+        Args:
+            snapshot_data (Dict[str, Any]): Pełny stan grafu (``nodes`` i ``edges``).
+        """
+        self.snapshot_id = uuid.uuid4().hex
+        atomic_write_json(self.snapshot_path, dict(snapshot_data, snapshot_id=self.snapshot_id), indent=2)
+        self._write_journal([])
+        self.entries = 0
+
+    def _read_journal(self) -> Tuple[List[List[Any]], bool]:
+        """
+        Odczytuje poprawne wpisy dziennika.
+
+        Returns:
+            Tuple[List[List[Any]], bool]: Lista zmian oraz informacja, czy plik
+                dziennika był w pełni poprawny.
+        """
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return [], True
+
+        if not lines or not lines[0].endswith("\n"):
+            return [], False
+        try:
+            header = json.loads(lines[0])
+        except json.JSONDecodeError:
+            return [], False
+        if header.get("snapshot_id") is None or header.get("snapshot_id") != self.snapshot_id:
+            return [], False
+
+        changes = []
+        for line in lines[1:]:
+            # Wpis bez znaku nowej linii został przerwany w trakcie zapisu
+            if not line.endswith("\n"):
+                return changes, False
+            try:
+                changes.append(json.loads(line))
+            except json.JSONDecodeError:
+                return changes, False
+        return changes, True
+
+    def _write_journal(self, changes: List[List[Any]]) -> None:
+        """
+        Atomowo zastępuje plik dziennika nagłówkiem i podanymi wpisami.
+
+        Args:
+            changes (List[List[Any]]): Wpisy, które mają znaleźć się w dzienniku.
+        """
+        def write(f):
+            f.write(json.dumps({"snapshot_id": self.snapshot_id}) + "\n")
+            for change in changes:
+                f.write(json.dumps(change, ensure_ascii=False) + "\n")
+
+        atomic_write(self.journal_path, write)
@@ -0,0 +1,184 @@
+"""
+Moduł implementujący filtrowane widoki grafu.
+
+Ten moduł zawiera klasę GraphView - lekki widok na istniejący graf,
+który ogranicza widoczne wierzchołki i krawędzie bez kopiowania danych.
+Filtry są wyliczane leniwie, w momencie gdy algorytm pyta o wierzchołek
+lub przegląda sąsiadów (np. podczas relaksacji krawędzi w algorytmie
+Dijkstry), więc koszt widoku jest proporcjonalny do przeszukanej części grafu.
+
+Widok udostępnia ten sam interfejs co Graph (``nodes`` i ``neighbors``),
+więc może być przekazany do ``dijkstra``, ``shortest_path_tree``,
+``alt_search`` czy ``partition_graph``, a także posłużyć za podstawę
+kolejnego widoku. Zmiany w grafie są od razu widoczne w widoku.
+
+Example:
+    >>> airports = GraphView(graph, node_types={"airport"})
+    >>> fast = GraphView(airports, edge_filter=lambda a, b, edge: edge["time"] < 60)
+    >>> distance, path = dijkstra(fast, "WAW", "POZ")
+"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+class NodeView(Mapping):
+    """
+    Klasa reprezentująca widok wierzchołków przefiltrowanego grafu.
+
+    Odwzorowanie identyfikatorów na indeksy pochodzi z grafu bazowego,
+    więc stan algorytmów indeksowany jest tak samo jak dla całego grafu.
+    """
+
+    def __init__(self, view: "GraphView"):
+        """
+        Inicjalizuje widok wierzchołków.
+
+        Args:
+            view (GraphView): Widok grafu, do którego należą wierzchołki.
+        """
+        self._view = view
+        self._nodes = view.graph.nodes
+
+    def index(self, node_id) -> int:
+        """
+        Zwraca indeks wierzchołka w grafie bazowym.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            int: Indeks wierzchołka.
+        """
+        return self._nodes.index(node_id)
+
+    def node_id(self, index: int):
+        """
+        Zwraca identyfikator wierzchołka o podanym indeksie.
+
+        Args:
+            index (int): Indeks wierzchołka.
+
+        Returns:
+            Identyfikator wierzchołka.
+        """
+        return self._nodes.node_id(index)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Zwraca rozmiar przestrzeni indeksów grafu bazowego.
+
+        Returns:
+            int: Liczba przydzielonych indeksów.
+        """
+        return self._nodes.capacity
+
+    def type_of(self, node_id) -> str:
+        """
+        Zwraca typ wierzchołka.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            str: Typ wierzchołka.
+        """
+        return self._nodes.type_of(node_id)
+
+    def name_of(self, node_id) -> str:
+        """
+        Zwraca nazwę wierzchołka.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            str: Nazwa wierzchołka.
+        """
+        return self._nodes.name_of(node_id)
+
+    def __getitem__(self, node_id) -> Dict[str, Any]:
+        if not self._view.allows_node(node_id):
+            raise KeyError(node_id)
+        return self._nodes[node_id]
+
+    def __contains__(self, node_id) -> bool:
+        return self._view.allows_node(node_id)
+
+    def __iter__(self) -> Iterator:
+        allows_node = self._view.allows_node
+        return (node_id for node_id in self._nodes if allows_node(node_id))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class GraphView:
+    """
+    Klasa reprezentująca filtrowany widok grafu.
+
+    Attributes:
+        graph: Graf (lub inny widok), na który nałożono filtry.
+        nodes (NodeView): Widoczne wierzchołki.
+    """
+
+    def __init__(self, graph, node_types: Optional[Iterable[str]] = None,
+                 node_filter: Optional[Callable[[Any], bool]] = None,
+                 edge_filter: Optional[Callable[[Any, Any, Dict[str, Any]], bool]] = None,
+                 exclude_nodes: Iterable = (), exclude_edges: Iterable = ()):
+        """
+        Tworzy widok grafu.
+
+        Args:
+            graph: Graf udostępniający ``nodes`` (NodeStore) i ``neighbors(node_id)``.
+            node_types (Iterable[str], optional): Dozwolone typy wierzchołków.
+            node_filter (Callable, optional): Predykat ``node_filter(node_id)``.
+            edge_filter (Callable, optional): Predykat ``edge_filter(od, do, atrybuty)``.
+            exclude_nodes (Iterable, optional): Wykluczone wierzchołki.
+            exclude_edges (Iterable, optional): Wykluczone krawędzie jako pary (od, do).
+        """
+        self.graph = graph
+        self.node_types = set(node_types) if node_types is not None else None
+        self.node_filter = node_filter
+        self.edge_filter = edge_filter
+        self.exclude_nodes = set(exclude_nodes)
+        self.exclude_edges = set(exclude_edges)
+        self.nodes = NodeView(self)
+
+    def allows_node(self, node_id) -> bool:
+        """
+        Sprawdza, czy wierzchołek jest widoczny w widoku.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            bool: True jeśli wierzchołek istnieje w grafie bazowym i spełnia filtry.
+        """
+        if node_id in self.exclude_nodes or node_id not in self.graph.nodes:
+            return False
+        if self.node_types is not None and self.graph.nodes.type_of(node_id) not in self.node_types:
+            return False
+        return self.node_filter is None or self.node_filter(node_id)
+
+    def neighbors(self, node_id):
+        """
+        Zwraca widocznych sąsiadów wierzchołka wraz z atrybutami krawędzi.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            Iterable: Pary (identyfikator sąsiada, słownik atrybutów krawędzi).
+        """
+        if not self.allows_node(node_id):
+            return
+        for neighbor, attributes in self.graph.neighbors(node_id):
+            if self.exclude_edges and (node_id, neighbor) in self.exclude_edges:
+                continue
+            if not self.allows_node(neighbor):
+                continue
+            if self.edge_filter is not None and not self.edge_filter(node_id, neighbor, attributes):
+                continue
+            yield neighbor, attributes
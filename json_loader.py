@@ -10,7 +10,9 @@ Attributes:
 """
 
 import json
-from typing import Dict, List, Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
     """
@@ -51,6 +53,11 @@ def load_graph_from_json(file_path: str) -> 'Graph':
     """
     Wczytuje graf z pliku JSON i tworzy obiekt Graph.
 
+    Jeśli obok pliku istnieje dziennik zmian należący do tej migawki
+    (zob. moduł graph_journal), zapisane w nim zmiany są odtwarzane,
+    więc zwracany graf odpowiada ostatniemu zapisowi. Pliki nie są
+    przy tym modyfikowane.
+
     Args:
         file_path (str): Ścieżka do pliku JSON.
 
@@ -62,6 +69,7 @@ def load_graph_from_json(file_path: str) -> 'Graph':
         ValueError: Gdy struktura danych jest niepoprawna.
     """
     from graph import Graph  
+    from graph_journal import GraphJournal, apply_change
     
     data = load_json_file(file_path)
     if not validate_graph_data(data):
@@ -71,7 +79,8 @@ def load_graph_from_json(file_path: str) -> 'Graph':
     
     # Dodawanie węzłów
     for node in data['nodes']:
-        graph.add_node(node['id'], node['type'], node['name'])
+        coords = (node['x'], node['y']) if 'x' in node and 'y' in node else None
+        graph.add_node(node['id'], node['type'], node['name'], coords=coords)
     
     # Dodawanie krawędzi
     for edge in data['edges']:
@@ -81,5 +90,144 @@ def load_graph_from_json(file_path: str) -> 'Graph':
             distance=edge.get('distance'),
             time=edge.get('time')
         )
+
+    # Odtwarzanie zmian zapisanych po migawce
+    for change in GraphJournal(file_path).read_changes(data.get('snapshot_id')):
+        apply_change(graph, change)
     
     return graph
+
+
+class MergeReport:
+    """
+    Raport z łączenia fragmentów grafu.
+
+    Attributes:
+        node_conflicts (list): Wierzchołki zdefiniowane różnie w kilku plikach,
+            jako krotki (id, plik z użytą definicją, plik z odrzuconą definicją).
+        edge_conflicts (list): Krawędzie zdefiniowane różnie w kilku plikach,
+            jako krotki (od, do, plik z użytą definicją, plik z odrzuconą definicją).
+        duplicate_nodes (int): Liczba identycznych, powtórzonych definicji wierzchołków.
+        duplicate_edges (int): Liczba identycznych, powtórzonych definicji krawędzi.
+        dangling_edges (list): Pominięte krawędzie do nieistniejących wierzchołków,
+            jako krotki (od, do, plik).
+    """
+
+    def __init__(self):
+        """
+        Inicjalizuje pusty raport.
+        """
+        self.node_conflicts = []
+        self.edge_conflicts = []
+        self.duplicate_nodes = 0
+        self.duplicate_edges = 0
+        self.dangling_edges = []
+
+    @property
+    def has_conflicts(self) -> bool:
+        """
+        Informuje, czy wystąpiły konflikty definicji.
+
+        Returns:
+            bool: True jeśli któryś wierzchołek lub krawędź zdefiniowano niejednoznacznie.
+        """
+        return bool(self.node_conflicts or self.edge_conflicts)
+
+
+def parse_shard(file_path: str) -> Tuple[List[tuple], List[tuple]]:
+    """
+    Wczytuje pojedynczy plik fragmentu grafu do postaci krotek.
+
+    Funkcja wykonywana jest w procesach roboczych, dlatego zwraca wyłącznie
+    proste struktury, tanie w serializacji.
+
+    Args:
+        file_path (str): Ścieżka do pliku JSON.
+
+    Returns:
+        Tuple[List[tuple], List[tuple]]: Wierzchołki (id, typ, nazwa, współrzędne)
+            oraz krawędzie (od, do, distance, time).
+
+    Raises:
+        ValueError: Gdy struktura danych jest niepoprawna.
+    """
+    data = load_json_file(file_path)
+    if not validate_graph_data(data):
+        raise ValueError(f"Niepoprawna struktura danych grafu: {file_path}")
+    nodes = [
+        (node['id'], node['type'], node['name'],
+         (node['x'], node['y']) if 'x' in node and 'y' in node else None)
+        for node in data['nodes']
+    ]
+    edges = [
+        (edge['from'], edge['to'], edge.get('distance'), edge.get('time'))
+        for edge in data['edges']
+    ]
+    return nodes, edges
+
+
+def load_graph_from_shards(file_paths: Iterable[str], max_workers: Optional[int] = None) -> Tuple['Graph', MergeReport]:
+    """
+    Wczytuje graf z wielu plików JSON równolegle i łączy je w jeden graf.
+
+    Równolegle (w puli procesów) odbywa się tylko parsowanie plików; łączenie
+    fragmentów i budowa grafu pozostają sekwencyjne w procesie wywołującym.
+    Przy łączeniu pierwsza definicja wierzchołka lub krawędzi (w kolejności
+    plików) jest zachowywana, a odmienne powtórzenia trafiają do raportu.
+    Lista sąsiedztwa budowana jest jednym przebiegiem po wszystkich krawędziach.
+
+    Args:
+        file_paths (Iterable[str]): Ścieżki do plików fragmentów.
+        max_workers (Optional[int]): Maksymalna liczba procesów; domyślnie liczba
+            rdzeni. Używanych jest najwyżej tyle procesów, ile plików, a gdy
+            wychodzi jeden proces, pliki parsowane są bez tworzenia puli.
+
+    Returns:
+        Tuple[Graph, MergeReport]: Połączony graf oraz raport z łączenia.
+
+    Raises:
+        FileNotFoundError: Gdy któryś z plików nie zostanie znaleziony.
+        ValueError: Gdy struktura danych któregoś pliku jest niepoprawna.
+    """
+    from graph import Graph
+
+    file_paths = list(file_paths)
+    workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+    if workers <= 1:
+        shards = [parse_shard(file_path) for file_path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = list(executor.map(parse_shard, file_paths))
+
+    report = MergeReport()
+    graph = Graph()
+    node_sources = {}
+    for file_path, (nodes, _) in zip(file_paths, shards):
+        for node_id, node_type, name, coords in nodes:
+            source = node_sources.get(node_id)
+            if source is None:
+                node_sources[node_id] = (file_path, node_type, name, coords)
+                graph.add_node(node_id, node_type, name, coords=coords)
+            elif source[1:] == (node_type, name, coords):
+                report.duplicate_nodes += 1
+            else:
+                report.node_conflicts.append((node_id, source[0], file_path))
+
+    adjacency = {}
+    edge_sources = {}
+    for file_path, (_, edges) in zip(file_paths, shards):
+        for from_node, to_node, distance, time in edges:
+            if from_node not in node_sources or to_node not in node_sources:
+                report.dangling_edges.append((from_node, to_node, file_path))
+                continue
+            targets = adjacency.setdefault(from_node, {})
+            if to_node not in targets:
+                targets[to_node] = {"distance": distance, "time": time}
+                edge_sources[(from_node, to_node)] = file_path
+            elif targets[to_node] == {"distance": distance, "time": time}:
+                report.duplicate_edges += 1
+            else:
+                report.edge_conflicts.append((from_node, to_node, edge_sources[(from_node, to_node)], file_path))
+    graph.edges = adjacency
+
+    return graph, report
@@ -0,0 +1,318 @@
+"""
+Moduł implementujący wyszukiwanie ALT (A*, Landmarks, Triangle inequality).
+
+Dla grafów bez współrzędnych heurystykę A* wyznacza się z odległości do
+i od kilku wybranych wierzchołków (punktów orientacyjnych). Z nierówności
+trójkąta dla punktu orientacyjnego L:
+
+    d(v, t) >= d(L, t) - d(L, v)    oraz    d(v, t) >= d(v, L) - d(t, L)
+
+Tablice odległości przechowywane są jako ``array('d')`` indeksowane gęstymi
+indeksami wierzchołków (NodeStore) i mogą być zapisane obok grafu w pliku
+binarnym. Po zmianie grafu tablice należy wyznaczyć ponownie.
+
+Example:
+    >>> table = build_landmarks(graph, count=8)
+    >>> table.save("graph.landmarks")
+    >>> distance, path = alt_search(graph, "A", "B", table)
+"""
+
+import heapq
+import json
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from adjacency import index_adjacency
+from shortest_path import INF, edge_weight
+
+
+def _distances(capacity: int, source: int, adjacency: Dict[int, List[Tuple[int, float]]]) -> array:
+    """
+    Wyznacza odległości z jednego źródła po liście sąsiedztwa indeksów.
+
+    Args:
+        capacity (int): Rozmiar przestrzeni indeksów.
+        source (int): Indeks wierzchołka źródłowego.
+        adjacency (Dict[int, List[Tuple[int, float]]]): Sąsiedztwo ``{indeks: [(indeks, waga)]}``.
+
+    Returns:
+        array: Odległości do wszystkich wierzchołków (INF dla nieosiągalnych).
+    """
+    distances = array("d", [INF]) * capacity
+    distances[source] = 0.0
+    settled = bytearray(capacity)
+    queue = [(0.0, source)]
+    while queue:
+        distance, node = heapq.heappop(queue)
+        if settled[node]:
+            continue
+        settled[node] = 1
+        for neighbor, weight in adjacency.get(node, ()):
+            new_distance = distance + weight
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                heapq.heappush(queue, (new_distance, neighbor))
+    return distances
+
+
+def _adjacency(graph, weight: str) -> Tuple[Dict, Dict]:
+    """
+    Buduje listy sąsiedztwa indeksów w obu kierunkach.
+
+    Args:
+        graph: Graf udostępniający ``nodes`` (NodeStore) i ``neighbors(node_id)``.
+        weight (str): Atrybut krawędzi używany jako waga.
+
+    Returns:
+        Tuple[Dict, Dict]: Sąsiedztwo w przód oraz sąsiedztwo odwrócone.
+    """
+    nodes = graph.nodes
+    adjacency = index_adjacency(graph)
+    forward = {}
+    backward = {}
+    for node in nodes:
+        node_index = nodes.index(node)
+        for neighbor_index, attributes in adjacency[node_index]:
+            cost = edge_weight(attributes, weight)
+            if cost == INF:
+                continue
+            forward.setdefault(node_index, []).append((neighbor_index, cost))
+            backward.setdefault(neighbor_index, []).append((node_index, cost))
+    return forward, backward
+
+
+class LandmarkTable:
+    """
+    Klasa przechowująca tablice odległości punktów orientacyjnych.
+
+    Attributes:
+        nodes (NodeStore): Magazyn wierzchołków grafu.
+        landmarks (list): Identyfikatory punktów orientacyjnych.
+        weight (str): Atrybut krawędzi, dla którego wyznaczono odległości.
+        forward (List[array]): Odległości d(L, v) dla każdego punktu L.
+        backward (List[array]): Odległości d(v, L) dla każdego punktu L.
+    """
+
+    def __init__(self, nodes, landmarks: List, weight: str, forward: List[array], backward: List[array]):
+        """
+        Inicjalizuje tablicę na podstawie wyznaczonych odległości.
+
+        Args:
+            nodes (NodeStore): Magazyn wierzchołków grafu.
+            landmarks (List): Identyfikatory punktów orientacyjnych.
+            weight (str): Atrybut krawędzi użyty jako waga.
+            forward (List[array]): Odległości od punktów orientacyjnych.
+            backward (List[array]): Odległości do punktów orientacyjnych.
+        """
+        self.nodes = nodes
+        self.landmarks = landmarks
+        self.weight = weight
+        self.forward = forward
+        self.backward = backward
+
+    def lower_bound(self, node: int, target: int) -> float:
+        """
+        Zwraca dolne ograniczenie odległości między wierzchołkami.
+
+        Args:
+            node (int): Indeks wierzchołka.
+            target (int): Indeks wierzchołka docelowego.
+
+        Returns:
+            float: Dolne ograniczenie d(node, target); INF gdy cel jest
+                na pewno nieosiągalny.
+        """
+        bound = 0.0
+        for forward, backward in zip(self.forward, self.backward):
+            if node >= len(forward) or target >= len(forward):
+                continue
+            from_landmark, to_landmark = forward[node], forward[target]
+            if to_landmark == INF:
+                # Cel nieosiągalny z L, a node osiągalny - node nie dojdzie do celu
+                if from_landmark != INF:
+                    return INF
+            elif to_landmark - from_landmark > bound:
+                bound = to_landmark - from_landmark
+            from_node, from_target = backward[node], backward[target]
+            if from_node == INF:
+                # Cel dochodzi do L, a node nie - node nie dojdzie też do celu
+                if from_target != INF:
+                    return INF
+            elif from_node - from_target > bound:
+                bound = from_node - from_target
+        return bound
+
+    def save(self, file_path: str) -> None:
+        """
+        Zapisuje tablice do pliku binarnego.
+
+        Plik zawiera wiersz nagłówka JSON (punkty orientacyjne, waga i kolejność
+        identyfikatorów wierzchołków), po którym następują surowe tablice ``array('d')``.
+
+        Args:
+            file_path (str): Ścieżka do pliku.
+        """
+        header = {
+            "landmarks": self.landmarks,
+            "weight": self.weight,
+            "node_ids": [self.nodes.node_id(index) for index in range(len(self.forward[0]))] if self.forward else [],
+        }
+        with open(file_path, "wb") as f:
+            f.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+            for values in self.forward + self.backward:
+                values.tofile(f)
+
+
+def build_landmarks(graph, count: int = 8, weight: str = "distance") -> LandmarkTable:
+    """
+    Wybiera punkty orientacyjne i wyznacza tablice odległości.
+
+    Punkty wybierane są zachłannie: każdy kolejny jest wierzchołkiem
+    najdalszym od już wybranych (wierzchołki nieosiągalne mają pierwszeństwo,
+    dzięki czemu punkty trafiają do różnych składowych grafu).
+
+    Args:
+        graph: Graf udostępniający ``nodes`` (NodeStore) i ``neighbors(node_id)``.
+        count (int, optional): Liczba punktów orientacyjnych. Domyślnie 8.
+        weight (str, optional): Atrybut krawędzi używany jako waga. Domyślnie "distance".
+
+    Returns:
+        LandmarkTable: Tablice odległości punktów orientacyjnych.
+    """
+    nodes = graph.nodes
+    capacity = nodes.capacity
+    forward_adjacency, backward_adjacency = _adjacency(graph, weight)
+    candidates = [nodes.index(node) for node in nodes]
+    landmarks, forward, backward = [], [], []
+    # Najmniejsza odległość (w dowolnym kierunku) od wybranych punktów
+    nearest = dict.fromkeys(candidates, INF)
+
+    current = candidates[0] if candidates else None
+    while current is not None and len(landmarks) < count:
+        landmarks.append(nodes.node_id(current))
+        forward.append(_distances(capacity, current, forward_adjacency))
+        backward.append(_distances(capacity, current, backward_adjacency))
+        del nearest[current]
+        for index in nearest:
+            distance = min(forward[-1][index], backward[-1][index])
+            if distance < nearest[index]:
+                nearest[index] = distance
+        current = max(nearest, key=nearest.get) if nearest else None
+
+    return LandmarkTable(nodes, landmarks, weight, forward, backward)
+
+
+def load_landmarks(graph, file_path: str) -> LandmarkTable:
+    """
+    Wczytuje tablice zapisane przez ``LandmarkTable.save``.
+
+    Tablice są przenumerowywane na indeksy wierzchołków w podanym grafie.
+    Wierzchołki usunięte od czasu zapisu są pomijane (ograniczenia pozostają
+    poprawne), natomiast nowe wierzchołki wymagają ponownego wyznaczenia tablic.
+
+    Args:
+        graph: Graf, dla którego wyznaczono tablice.
+        file_path (str): Ścieżka do pliku.
+
+    Returns:
+        LandmarkTable: Wczytane tablice odległości.
+
+    Raises:
+        ValueError: Gdy graf zawiera wierzchołki nieobecne w pliku.
+    """
+    nodes = graph.nodes
+    with open(file_path, "rb") as f:
+        header = json.loads(f.readline().decode("utf-8"))
+        saved_ids = header["node_ids"]
+        tables = []
+        for _ in range(2 * len(header["landmarks"])):
+            values = array("d")
+            values.fromfile(f, len(saved_ids))
+            tables.append(values)
+
+    missing = set(nodes).difference(node_id for node_id in saved_ids if node_id is not None)
+    if missing:
+        raise ValueError(f"Landmark table is stale: {len(missing)} nodes are missing.")
+
+    capacity = nodes.capacity
+    remapped = []
+    for values in tables:
+        result = array("d", [0.0]) * capacity
+        for saved_index, node_id in enumerate(saved_ids):
+            if node_id is not None and node_id in nodes:
+                result[nodes.index(node_id)] = values[saved_index]
+        remapped.append(result)
+    count = len(header["landmarks"])
+    return LandmarkTable(nodes, header["landmarks"], header["weight"], remapped[:count], remapped[count:])
+
+
+def alt_search(graph, start, end, table: Optional[LandmarkTable], stats: Optional[Dict] = None) -> Tuple[float, List]:
+    """
+    Wyszukiwanie A* z ograniczeniami dolnymi z punktów orientacyjnych.
+
+    Bez tablicy (``table=None``) działa jak zwykły algorytm Dijkstry, co
+    pozwala porównać liczbę rozliczonych wierzchołków.
+
+    Args:
+        graph: Graf udostępniający ``nodes`` (NodeStore) i ``neighbors(node_id)``.
+        start: Wierzchołek początkowy.
+        end: Wierzchołek końcowy.
+        table (Optional[LandmarkTable]): Tablice punktów orientacyjnych.
+        stats (Optional[Dict]): Słownik, do którego zapisywana jest liczba
+            rozliczonych wierzchołków (klucz ``"settled"``).
+
+    Returns:
+        Tuple[float, List]: Długość najkrótszej ścieżki oraz lista jej wierzchołków.
+
+    Raises:
+        ValueError: Gdy start lub end nie istnieją w grafie.
+    """
+    nodes = graph.nodes
+    if start not in nodes or end not in nodes:
+        raise ValueError("Both start and end nodes must exist in the graph.")
+    weight = table.weight if table is not None else "distance"
+    start_index = nodes.index(start)
+    end_index = nodes.index(end)
+    adjacency = index_adjacency(graph)
+
+    def potential(index):
+        return table.lower_bound(index, end_index) if table is not None else 0.0
+
+    distances = {start_index: 0.0}
+    previous = {start_index: -1}
+    settled = set()
+    start_bound = potential(start_index)
+    priority_queue = [(start_bound, start_index)] if start_bound != INF else []
+    result = INF, []
+
+    while priority_queue:
+        _, current_index = heapq.heappop(priority_queue)
+        if current_index in settled:
+            continue
+        settled.add(current_index)
+        if current_index == end_index:
+            path = []
+            current = end_index
+            while current != -1:
+                path.append(nodes.node_id(current))
+                current = previous[current]
+            path.reverse()
+            result = distances[end_index], path
+            break
+
+        current_distance = distances[current_index]
+        for neighbor_index, attributes in adjacency[current_index]:
+            if neighbor_index in settled:
+                continue
+            new_distance = current_distance + edge_weight(attributes, weight)
+            if new_distance < distances.get(neighbor_index, INF):
+                bound = potential(neighbor_index)
+                if bound == INF:
+                    continue
+                distances[neighbor_index] = new_distance
+                previous[neighbor_index] = current_index
+                heapq.heappush(priority_queue, (new_distance + bound, neighbor_index))
+
+    if stats is not None:
+        stats["settled"] = len(settled)
+    return result
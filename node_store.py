@@ -0,0 +1,183 @@
+"""
+Moduł implementujący kolumnowe przechowywanie wierzchołków grafu.
+
+Ten moduł zawiera klasę NodeStore, która zastępuje słownik
+``{id: {"type": ..., "name": ...}}``. Każdy wierzchołek otrzymuje gęsty
+indeks całkowity, a jego atrybuty przechowywane są w kolumnach:
+typy jako kody w tablicy ``array`` odwołujące się do tabeli unikalnych
+typów, nazwy jako internowane napisy. Identyfikatory będące napisami
+również są internowane. Dzięki temu algorytmy mogą przechowywać stan
+w listach indeksowanych numerem wierzchołka zamiast w słownikach
+kluczowanych identyfikatorami (zob. też moduł adjacency).
+
+Interfejs słownika jest zachowany: ``store[node_id]`` zwraca nowy słownik
+``{"type": ..., "name": ...}`` (jego modyfikacja nie zmienia magazynu).
+
+Example:
+    >>> store = NodeStore()
+    >>> store.add("WAW", "airport", "Warszawa")
+    0
+    >>> store["WAW"]["type"]
+    'airport'
+    >>> store.index("WAW")
+    0
+"""
+
+import sys
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator
+
+
+def _intern(value):
+    """Internuje napisy, pozostałe wartości zwraca bez zmian."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class NodeStore(MutableMapping):
+    """
+    Klasa przechowująca wierzchołki grafu w postaci kolumnowej.
+
+    Indeksy usuniętych wierzchołków są ponownie wykorzystywane, więc
+    ``capacity`` jest zawsze nie mniejsze niż największy używany indeks + 1.
+
+    Attributes:
+        types (list): Tabela unikalnych typów wierzchołków.
+    """
+
+    def __init__(self):
+        """
+        Inicjalizuje pusty magazyn wierzchołków.
+        """
+        self._index = {}  # identyfikator -> indeks
+        self._ids = []  # indeks -> identyfikator (None dla wolnego miejsca)
+        self._type_codes = array("i")  # indeks -> kod typu
+        self._names = []  # indeks -> internowana nazwa
+        self._free = []  # wolne indeksy po usuniętych wierzchołkach
+        self.types = []
+        self._type_lookup = {}
+
+    def add(self, node_id, node_type, name) -> int:
+        """
+        Dodaje lub nadpisuje wierzchołek.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+            node_type (str): Typ wierzchołka.
+            name (str): Nazwa wierzchołka.
+
+        Returns:
+            int: Indeks wierzchołka.
+        """
+        code = self._type_lookup.get(node_type)
+        if code is None:
+            code = len(self.types)
+            node_type = _intern(node_type)
+            self.types.append(node_type)
+            self._type_lookup[node_type] = code
+        name = _intern(name)
+
+        index = self._index.get(node_id)
+        if index is None:
+            node_id = _intern(node_id)
+            if self._free:
+                index = self._free.pop()
+                self._ids[index] = node_id
+                self._type_codes[index] = code
+                self._names[index] = name
+            else:
+                index = len(self._ids)
+                self._ids.append(node_id)
+                self._type_codes.append(code)
+                self._names.append(name)
+            self._index[node_id] = index
+        else:
+            self._type_codes[index] = code
+            self._names[index] = name
+        return index
+
+    def index(self, node_id) -> int:
+        """
+        Zwraca indeks wierzchołka.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            int: Indeks wierzchołka.
+
+        Raises:
+            KeyError: Gdy wierzchołek nie istnieje.
+        """
+        return self._index[node_id]
+
+    def node_id(self, index: int):
+        """
+        Zwraca identyfikator wierzchołka o podanym indeksie.
+
+        Args:
+            index (int): Indeks wierzchołka.
+
+        Returns:
+            Identyfikator wierzchołka lub None dla wolnego indeksu.
+        """
+        return self._ids[index]
+
+    @property
+    def capacity(self) -> int:
+        """
+        Zwraca rozmiar przestrzeni indeksów (długość list stanu algorytmów).
+
+        Returns:
+            int: Liczba przydzielonych indeksów, łącznie z wolnymi.
+        """
+        return len(self._ids)
+
+    def type_of(self, node_id) -> str:
+        """
+        Zwraca typ wierzchołka bez tworzenia słownika atrybutów.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            str: Typ wierzchołka.
+        """
+        return self.types[self._type_codes[self._index[node_id]]]
+
+    def name_of(self, node_id) -> str:
+        """
+        Zwraca nazwę wierzchołka bez tworzenia słownika atrybutów.
+
+        Args:
+            node_id: Identyfikator wierzchołka.
+
+        Returns:
+            str: Nazwa wierzchołka.
+        """
+        return self._names[self._index[node_id]]
+
+    def __getitem__(self, node_id) -> Dict[str, Any]:
+        index = self._index[node_id]
+        return {"type": self.types[self._type_codes[index]], "name": self._names[index]}
+
+    def __setitem__(self, node_id, node_data: Dict[str, Any]) -> None:
+        self.add(node_id, node_data["type"], node_data["name"])
+
+    def __delitem__(self, node_id) -> None:
+        index = self._index.pop(node_id)
+        self._ids[index] = None
+        self._names[index] = None
+        self._free.append(index)
+
+    def __contains__(self, node_id) -> bool:
+        return node_id in self._index
+
+    def __iter__(self) -> Iterator:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
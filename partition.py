@@ -0,0 +1,494 @@
+"""
+Moduł implementujący podział grafu na komórki i wyszukiwanie z nakładką.
+
+Graf dzielony jest na komórki o ograniczonym rozmiarze. Wierzchołki,
+z których wychodzi lub do których wchodzi krawędź łącząca różne komórki,
+są wierzchołkami brzegowymi. Dla każdej komórki wyznaczane są odległości
+między jej wierzchołkami brzegowymi (klika nakładki), liczone tylko po
+krawędziach wewnątrz komórki.
+
+Zapytanie przeszukuje oryginalne krawędzie wyłącznie w komórkach startu
+i celu, a resztę grafu pokonuje krawędziami nakładki (kliki + krawędzie
+między komórkami). Każda krawędź kliki przechowuje wewnętrzne wierzchołki
+odpowiadającej jej ścieżki w komórce, więc rozwinięcie ścieżki nie wymaga
+wczytywania komórek, przez które prowadzi trasa.
+
+Podział zapisywany jest w katalogu: plik ``overlay.json`` zawiera przypisanie
+wierzchołków do komórek, kliki i krawędzie między komórkami, a każda komórka
+trafia do osobnego pliku ``cell_<id>.json``, wczytywanego dopiero przy
+pierwszym użyciu. Zmiana wag krawędzi wymaga ponownego przeliczenia
+(``customize``) tylko zmienionych komórek.
+
+Example:
+    >>> partition = partition_graph(graph, cell_size=1000)
+    >>> partition.save("partitions")
+    >>> worker = load_partition("partitions")
+    >>> distance, path = worker.query("WAW", "KRK")
+
+Attributes:
+    OVERLAY_FILE (str): Nazwa pliku nakładki w katalogu podziału.
+"""
+
+import heapq
+import os
+import json
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from graph_journal import atomic_write_json
+from shortest_path import INF, edge_weight
+
+OVERLAY_FILE = "overlay.json"
+
+
+def _search(source, neighbors: Callable, targets: Optional[set] = None) -> Tuple[Dict, Dict]:
+    """
+    Przeszukiwanie Dijkstry po dowolnej funkcji sąsiedztwa.
+
+    Args:
+        source: Wierzchołek początkowy.
+        neighbors (Callable): Funkcja zwracająca pary (sąsiad, waga, etykieta krawędzi).
+        targets (Optional[set]): Wierzchołki, po rozliczeniu których można zakończyć.
+
+    Returns:
+        Tuple[Dict, Dict]: Odległości rozliczonych wierzchołków oraz poprzedniki
+            w postaci ``{wierzchołek: (poprzednik, etykieta krawędzi)}``.
+    """
+    distances = {source: 0}
+    previous = {source: None}
+    settled = {}
+    remaining = set(targets) if targets else None
+    queue = [(0, 0, source)]
+    counter = 1
+    while queue:
+        distance, _, node = heapq.heappop(queue)
+        if node in settled:
+            continue
+        settled[node] = distance
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+        for neighbor, weight, label in neighbors(node):
+            new_distance = distance + weight
+            if new_distance < distances.get(neighbor, INF):
+                distances[neighbor] = new_distance
+                previous[neighbor] = (node, label)
+                # Licznik rozstrzyga remisy bez porównywania identyfikatorów
+                heapq.heappush(queue, (new_distance, counter, neighbor))
+                counter += 1
+    return settled, previous
+
+
+class Cell:
+    """
+    Klasa reprezentująca komórkę podziału grafu.
+
+    Attributes:
+        cell_id (int): Identyfikator komórki.
+        nodes (list): Wierzchołki komórki jako krotki (id, typ, nazwa).
+        edges (dict): Krawędzie wewnątrz komórki ``{od: {do: atrybuty}}``.
+    """
+
+    def __init__(self, cell_id: int):
+        """
+        Inicjalizuje pustą komórkę.
+
+        Args:
+            cell_id (int): Identyfikator komórki.
+        """
+        self.cell_id = cell_id
+        self.nodes = []
+        self.edges = {}
+
+    def local_neighbors(self, weight: str) -> Callable:
+        """
+        Zwraca funkcję sąsiedztwa ograniczoną do krawędzi komórki.
+
+        Args:
+            weight (str): Atrybut krawędzi używany jako waga.
+
+        Returns:
+            Callable: Funkcja sąsiedztwa dla ``_search``.
+        """
+        def neighbors(node):
+            for neighbor, attributes in self.edges.get(node, {}).items():
+                cost = edge_weight(attributes, weight)
+                if cost != INF:
+                    yield neighbor, cost, None
+        return neighbors
+
+    def clique(self, boundary: Iterable, weight: str) -> Dict[Any, List[Tuple[Any, float, List]]]:
+        """
+        Wyznacza odległości i ścieżki między wierzchołkami brzegowymi komórki.
+
+        Args:
+            boundary (Iterable): Wierzchołki brzegowe komórki.
+            weight (str): Atrybut krawędzi używany jako waga.
+
+        Returns:
+            Dict[Any, List[Tuple[Any, float, List]]]: Krawędzie kliki
+                ``{od: [(do, odległość, wierzchołki pośrednie)]}``.
+        """
+        boundary = set(boundary)
+        neighbors = self.local_neighbors(weight)
+        clique = {}
+        for source in boundary:
+            settled, previous = _search(source, neighbors, boundary)
+            edges = []
+            for target in boundary:
+                if target == source or target not in settled:
+                    continue
+                via = []
+                current = previous[target][0]
+                while current != source:
+                    via.append(current)
+                    current = previous[current][0]
+                via.reverse()
+                edges.append((target, settled[target], via))
+            clique[source] = edges
+        return clique
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Konwertuje komórkę do formatu JSON.
+
+        Returns:
+            Dict[str, Any]: Wierzchołki i krawędzie komórki.
+        """
+        return {
+            "cell": self.cell_id,
+            "nodes": [list(node) for node in self.nodes],
+            "edges": [[from_node, to_node, attributes]
+                      for from_node, targets in self.edges.items()
+                      for to_node, attributes in targets.items()],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Cell":
+        """
+        Tworzy komórkę na podstawie danych JSON.
+
+        Args:
+            data (Dict[str, Any]): Dane zapisane przez ``to_json``.
+
+        Returns:
+            Cell: Odtworzona komórka.
+        """
+        cell = cls(data["cell"])
+        cell.nodes = [tuple(node) for node in data["nodes"]]
+        for from_node, to_node, attributes in data["edges"]:
+            cell.edges.setdefault(from_node, {})[to_node] = attributes
+        return cell
+
+
+class Partition:
+    """
+    Klasa reprezentująca podział grafu wraz z nakładką.
+
+    Attributes:
+        weight (str): Atrybut krawędzi używany jako waga.
+        cell_of (dict): Przypisanie wierzchołków do komórek.
+        boundary (dict): Wierzchołki brzegowe każdej komórki.
+        cliques (dict): Krawędzie kliki każdej komórki.
+        cut_edges (dict): Krawędzie między komórkami ``{od: {do: atrybuty}}``.
+        directory (Optional[str]): Katalog, z którego wczytywane są komórki.
+    """
+
+    def __init__(self, weight: str = "distance", directory: Optional[str] = None):
+        """
+        Inicjalizuje pusty podział.
+
+        Args:
+            weight (str): Atrybut krawędzi używany jako waga.
+            directory (Optional[str]): Katalog z zapisanymi komórkami.
+        """
+        self.weight = weight
+        self.directory = directory
+        self.cell_of = {}
+        self.boundary = {}
+        self.cliques = {}
+        self.cut_edges = {}
+        self._cells = {}
+        self._dirty = set()
+
+    def cell(self, cell_id: int) -> Cell:
+        """
+        Zwraca komórkę, wczytując ją z dysku przy pierwszym użyciu.
+
+        Args:
+            cell_id (int): Identyfikator komórki.
+
+        Returns:
+            Cell: Komórka podziału.
+        """
+        if cell_id not in self._cells:
+            path = os.path.join(self.directory, f"cell_{cell_id}.json")
+            with open(path, "r", encoding="utf-8") as f:
+                self._cells[cell_id] = Cell.from_json(json.load(f))
+        return self._cells[cell_id]
+
+    @property
+    def loaded_cells(self) -> List[int]:
+        """
+        Zwraca identyfikatory komórek obecnych w pamięci.
+
+        Returns:
+            List[int]: Identyfikatory wczytanych komórek.
+        """
+        return sorted(self._cells)
+
+    def update_edge(self, from_node, to_node, **attributes) -> None:
+        """
+        Zmienia atrybuty istniejącej krawędzi i oznacza jej komórkę do przeliczenia.
+
+        Args:
+            from_node: Identyfikator wierzchołka początkowego.
+            to_node: Identyfikator wierzchołka końcowego.
+            **attributes: Nowe wartości atrybutów krawędzi.
+
+        Raises:
+            KeyError: Gdy krawędź nie istnieje.
+        """
+        if to_node in self.cut_edges.get(from_node, {}):
+            # Krawędzie między komórkami nie wchodzą do klik - wystarczy je podmienić
+            self.cut_edges[from_node][to_node].update(attributes)
+            return
+        cell = self.cell(self.cell_of[from_node])
+        cell.edges[from_node][to_node].update(attributes)
+        self._dirty.add(cell.cell_id)
+
+    def customize(self, cell_ids: Optional[Iterable[int]] = None, weight: Optional[str] = None) -> List[int]:
+        """
+        Przelicza kliki nakładki.
+
+        Args:
+            cell_ids (Optional[Iterable[int]]): Komórki do przeliczenia; domyślnie
+                komórki zmienione przez ``update_edge`` albo wszystkie przy zmianie wagi.
+            weight (Optional[str]): Nowy atrybut wagi.
+
+        Returns:
+            List[int]: Identyfikatory przeliczonych komórek.
+        """
+        if weight is not None and weight != self.weight:
+            self.weight = weight
+            cell_ids = self.boundary.keys()
+        elif cell_ids is None:
+            cell_ids = self._dirty
+        cell_ids = sorted(set(cell_ids))
+        for cell_id in cell_ids:
+            self.cliques[cell_id] = self.cell(cell_id).clique(self.boundary[cell_id], self.weight)
+        self._dirty.difference_update(cell_ids)
+        return cell_ids
+
+    def query(self, start, end) -> Tuple[float, List]:
+        """
+        Znajduje najkrótszą ścieżkę, przeszukując tylko komórki startu i celu oraz nakładkę.
+
+        Args:
+            start: Wierzchołek początkowy.
+            end: Wierzchołek końcowy.
+
+        Returns:
+            Tuple[float, List]: Długość najkrótszej ścieżki oraz lista jej wierzchołków
+                (pusta, gdy ścieżka nie istnieje).
+
+        Raises:
+            ValueError: Gdy start lub end nie należą do podziału.
+        """
+        if start not in self.cell_of or end not in self.cell_of:
+            raise ValueError("Both start and end nodes must exist in the partition.")
+        if self._dirty:
+            self.customize()
+
+        local = {self.cell_of[start], self.cell_of[end]}
+        local_neighbors = {cell_id: self.cell(cell_id).local_neighbors(self.weight) for cell_id in local}
+
+        def neighbors(node):
+            cell_id = self.cell_of[node]
+            if cell_id in local:
+                yield from local_neighbors[cell_id](node)
+            else:
+                for neighbor, cost, via in self.cliques[cell_id].get(node, ()):
+                    yield neighbor, cost, (cell_id, via)
+            for neighbor, attributes in self.cut_edges.get(node, {}).items():
+                cost = edge_weight(attributes, self.weight)
+                if cost != INF:
+                    yield neighbor, cost, None
+
+        settled, previous = _search(start, neighbors, {end})
+        if end not in settled:
+            return INF, []
+
+        # Rekonstrukcja ścieżki z rozwinięciem krawędzi kliki
+        path = [end]
+        current = end
+        while previous[current] is not None:
+            parent, clique_edge = previous[current]
+            if clique_edge is not None:
+                cell_id, via = clique_edge
+                if via is None:
+                    via = self._unpack(cell_id, parent, current)[1:-1]
+                path.extend(reversed(via))
+            path.append(parent)
+            current = parent
+        path.reverse()
+        return settled[end], path
+
+    def _unpack(self, cell_id: int, source, target) -> List:
+        """
+        Rozwija krawędź kliki w ścieżkę wewnątrz komórki.
+
+        Używane tylko dla nakładek zapisanych bez ścieżek klik.
+
+        Args:
+            cell_id (int): Identyfikator komórki.
+            source: Początkowy wierzchołek brzegowy.
+            target: Końcowy wierzchołek brzegowy.
+
+        Returns:
+            List: Wierzchołki ścieżki od source do target.
+        """
+        _, previous = _search(source, self.cell(cell_id).local_neighbors(self.weight), {target})
+        path = [target]
+        while previous[path[-1]] is not None:
+            path.append(previous[path[-1]][0])
+        path.reverse()
+        return path
+
+    def save(self, directory: Optional[str] = None) -> None:
+        """
+        Zapisuje nakładkę i komórki do katalogu (każda komórka w osobnym pliku).
+
+        Przy zapisie do katalogu, z którego podział był wczytany, zapisywane są
+        tylko komórki obecne w pamięci. Komórki zmienione przez ``update_edge``
+        są przed zapisem przeliczane, aby plik nakładki nie zawierał
+        nieaktualnych klik.
+
+        Args:
+            directory (Optional[str]): Katalog docelowy; domyślnie katalog źródłowy.
+        """
+        if self._dirty:
+            self.customize()
+        directory = directory or self.directory
+        if self.directory is not None and os.path.abspath(directory) != os.path.abspath(self.directory):
+            for cell_id in self.boundary:
+                self.cell(cell_id)
+        os.makedirs(directory, exist_ok=True)
+        for cell_id, cell in self._cells.items():
+            atomic_write_json(os.path.join(directory, f"cell_{cell_id}.json"), cell.to_json())
+        atomic_write_json(os.path.join(directory, OVERLAY_FILE), {
+            "weight": self.weight,
+            "cell_of": [[node, cell_id] for node, cell_id in self.cell_of.items()],
+            "boundary": [[cell_id, nodes] for cell_id, nodes in self.boundary.items()],
+            "cliques": [[cell_id, [[from_node, to_node, cost, via]
+                                   for from_node, targets in clique.items()
+                                   for to_node, cost, via in targets]]
+                        for cell_id, clique in self.cliques.items()],
+            "cut_edges": [[from_node, to_node, attributes]
+                          for from_node, targets in self.cut_edges.items()
+                          for to_node, attributes in targets.items()],
+        })
+        self.directory = directory
+
+
+def partition_graph(graph, cell_size: int, weight: str = "distance") -> Partition:
+    """
+    Dzieli graf na komórki i wyznacza nakładkę.
+
+    Komórki budowane są przez przeszukiwanie wszerz (z pominięciem kierunku
+    krawędzi) od kolejnych nieprzypisanych wierzchołków, aż do osiągnięcia
+    ``cell_size`` wierzchołków.
+
+    Args:
+        graph: Graf udostępniający ``nodes`` i ``neighbors(node_id)``.
+        cell_size (int): Maksymalna liczba wierzchołków w komórce.
+        weight (str, optional): Atrybut krawędzi używany jako waga. Domyślnie "distance".
+
+    Returns:
+        Partition: Podział grafu z przeliczonymi klikami.
+
+    Raises:
+        ValueError: Gdy cell_size jest mniejsze niż 1.
+    """
+    if cell_size < 1:
+        raise ValueError("cell_size must be at least 1.")
+
+    undirected = {node: [] for node in graph.nodes}
+    for node in graph.nodes:
+        for neighbor, _ in graph.neighbors(node):
+            undirected[node].append(neighbor)
+            undirected[neighbor].append(node)
+
+    partition = Partition(weight)
+    cell_of = partition.cell_of
+    cell_id = 0
+    for seed in graph.nodes:
+        if seed in cell_of:
+            continue
+        cell_of[seed] = cell_id
+        size = 1
+        queue = deque([seed])
+        while queue and size < cell_size:
+            node = queue.popleft()
+            for neighbor in undirected[node]:
+                if neighbor not in cell_of and size < cell_size:
+                    cell_of[neighbor] = cell_id
+                    size += 1
+                    queue.append(neighbor)
+        cell_id += 1
+
+    cells = {cell: Cell(cell) for cell in range(cell_id)}
+    boundary = {cell: set() for cell in range(cell_id)}
+    for node in graph.nodes:
+        node_data = graph.nodes[node]
+        cells[cell_of[node]].nodes.append((node, node_data["type"], node_data["name"]))
+        for neighbor, attributes in graph.neighbors(node):
+            if cell_of[node] == cell_of[neighbor]:
+                targets = cells[cell_of[node]].edges.setdefault(node, {})
+            else:
+                targets = partition.cut_edges.setdefault(node, {})
+                boundary[cell_of[node]].add(node)
+                boundary[cell_of[neighbor]].add(neighbor)
+            # Z krawędzi równoległych zostaje najkrótsza
+            if neighbor not in targets or edge_weight(attributes, weight) < edge_weight(targets[neighbor], weight):
+                targets[neighbor] = dict(attributes)
+
+    for cell in cells.values():
+        # Klucz "to" pochodzi z listowego układu krawędzi graph_UI.Graph
+        for targets in cell.edges.values():
+            for attributes in targets.values():
+                attributes.pop("to", None)
+    for targets in partition.cut_edges.values():
+        for attributes in targets.values():
+            attributes.pop("to", None)
+
+    partition._cells = cells
+    partition.boundary = {cell: list(nodes) for cell, nodes in boundary.items()}
+    partition.customize(cells)
+    return partition
+
+
+def load_partition(directory: str) -> Partition:
+    """
+    Wczytuje nakładkę podziału; komórki wczytywane są dopiero przy użyciu.
+
+    Args:
+        directory (str): Katalog zapisany przez ``Partition.save``.
+
+    Returns:
+        Partition: Podział grafu bez wczytanych komórek.
+    """
+    with open(os.path.join(directory, OVERLAY_FILE), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    partition = Partition(data["weight"], directory)
+    partition.cell_of = {node: cell_id for node, cell_id in data["cell_of"]}
+    partition.boundary = {cell_id: nodes for cell_id, nodes in data["boundary"]}
+    for cell_id, edges in data["cliques"]:
+        clique = partition.cliques.setdefault(cell_id, {})
+        for from_node, to_node, cost, *via in edges:
+            # Starsze nakładki nie zawierają ścieżek klik - są wtedy rozwijane w komórce
+            clique.setdefault(from_node, []).append((to_node, cost, via[0] if via else None))
+    for from_node, to_node, attributes in data["cut_edges"]:
+        partition.cut_edges.setdefault(from_node, {})[to_node] = attributes
+    return partition
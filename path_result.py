@@ -0,0 +1,203 @@
+"""
+Moduł zawierający zwięzłe reprezentacje wyników wyszukiwania ścieżek.
+
+Ten moduł zawiera klasę ShortestPathTree - drzewo najkrótszych ścieżek
+z jednego źródła zapisane w tablicach ``array`` indeksowanych gęstymi
+indeksami wierzchołków (poprzedniki, odległości, głębokości i sumy
+atrybutów krawędzi) - oraz klasę PathResult, opisującą pojedynczą
+ścieżkę jako tablicę indeksów wierzchołków.
+
+Sumy atrybutów (np. ``distance`` i ``time``) odczytywane są z tablic
+skumulowanych w czasie O(1), a identyfikatory i nazwy wierzchołków
+tworzone są dopiero na żądanie.
+
+Example:
+    >>> tree = shortest_path_tree(graph, "WAW")
+    >>> results = tree.paths(["KRK", "GDN"])
+    >>> results[0].distance, results[0].node_ids()
+    (300.0, ['WAW', 'KRK'])
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+INF = float('inf')
+
+
+class PathResult:
+    """
+    Klasa reprezentująca pojedynczą ścieżkę.
+
+    Attributes:
+        nodes (NodeStore): Magazyn wierzchołków grafu, z którego pochodzi ścieżka.
+        indices (array): Indeksy kolejnych wierzchołków ścieżki.
+        cost (float): Długość ścieżki według wagi użytej w wyszukiwaniu.
+        totals (Dict[str, float]): Sumy atrybutów krawędzi wzdłuż ścieżki.
+    """
+
+    __slots__ = ("nodes", "indices", "cost", "totals", "_node_ids")
+
+    def __init__(self, nodes, indices: array, cost: float, totals: Dict[str, float]):
+        """
+        Inicjalizuje wynik wyszukiwania.
+
+        Args:
+            nodes (NodeStore): Magazyn wierzchołków grafu.
+            indices (array): Indeksy kolejnych wierzchołków ścieżki.
+            cost (float): Długość ścieżki.
+            totals (Dict[str, float]): Sumy atrybutów krawędzi wzdłuż ścieżki.
+        """
+        self.nodes = nodes
+        self.indices = indices
+        self.cost = cost
+        self.totals = totals
+        self._node_ids = None
+
+    @property
+    def found(self) -> bool:
+        """
+        Informuje, czy ścieżka istnieje.
+
+        Returns:
+            bool: True jeśli wierzchołek docelowy jest osiągalny.
+        """
+        return len(self.indices) > 0
+
+    @property
+    def distance(self) -> Optional[float]:
+        """
+        Zwraca sumę atrybutu ``distance`` wzdłuż ścieżki.
+
+        Returns:
+            Optional[float]: Suma odległości lub None, gdy nie była liczona.
+        """
+        return self.totals.get("distance")
+
+    @property
+    def time(self) -> Optional[float]:
+        """
+        Zwraca sumę atrybutu ``time`` wzdłuż ścieżki.
+
+        Returns:
+            Optional[float]: Suma czasów lub None, gdy nie była liczona.
+        """
+        return self.totals.get("time")
+
+    def node_ids(self) -> List:
+        """
+        Zwraca identyfikatory wierzchołków ścieżki (tworzone przy pierwszym wywołaniu).
+
+        Returns:
+            List: Identyfikatory kolejnych wierzchołków.
+        """
+        if self._node_ids is None:
+            node_id = self.nodes.node_id
+            self._node_ids = [node_id(index) for index in self.indices]
+        return self._node_ids
+
+    def names(self) -> List[str]:
+        """
+        Zwraca nazwy wierzchołków ścieżki.
+
+        Returns:
+            List[str]: Nazwy kolejnych wierzchołków.
+        """
+        name_of = self.nodes.name_of
+        return [name_of(node) for node in self.node_ids()]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __repr__(self) -> str:
+        return f"PathResult(cost={self.cost}, nodes={len(self.indices)}, totals={self.totals})"
+
+
+class ShortestPathTree:
+    """
+    Klasa reprezentująca drzewo najkrótszych ścieżek z jednego źródła.
+
+    Wszystkie tablice mają długość ``nodes.capacity``; nieosiągalne wierzchołki
+    mają poprzednika -1 i odległość INF.
+
+    Attributes:
+        nodes (NodeStore): Magazyn wierzchołków grafu.
+        source (int): Indeks wierzchołka źródłowego.
+        predecessors (array): Indeks poprzednika każdego wierzchołka.
+        distances (array): Długość najkrótszej ścieżki do każdego wierzchołka.
+        depths (array): Liczba krawędzi najkrótszej ścieżki do każdego wierzchołka.
+        totals (Dict[str, array]): Skumulowane sumy atrybutów krawędzi.
+    """
+
+    def __init__(self, nodes, source: int, predecessors: array, distances: array,
+                 depths: array, totals: Dict[str, array]):
+        """
+        Inicjalizuje drzewo na podstawie obliczonych tablic.
+
+        Args:
+            nodes (NodeStore): Magazyn wierzchołków grafu.
+            source (int): Indeks wierzchołka źródłowego.
+            predecessors (array): Tablica poprzedników.
+            distances (array): Tablica odległości.
+            depths (array): Tablica głębokości.
+            totals (Dict[str, array]): Skumulowane sumy atrybutów krawędzi.
+        """
+        self.nodes = nodes
+        self.source = source
+        self.predecessors = predecessors
+        self.distances = distances
+        self.depths = depths
+        self.totals = totals
+
+    def path_indices(self, target: int) -> array:
+        """
+        Odtwarza ścieżkę do wierzchołka jako tablicę indeksów.
+
+        Tablica wynikowa ma z góry znaną długość (głębokość + 1) i jest
+        wypełniana od końca, bez odwracania listy.
+
+        Args:
+            target (int): Indeks wierzchołka docelowego.
+
+        Returns:
+            array: Indeksy wierzchołków ścieżki (pusta, gdy cel jest nieosiągalny).
+        """
+        if self.distances[target] == INF:
+            return array("l")
+        predecessors = self.predecessors
+        position = self.depths[target]
+        indices = array("l", bytes(array("l").itemsize * (position + 1)))
+        current = target
+        while position >= 0:
+            indices[position] = current
+            current = predecessors[current]
+            position -= 1
+        return indices
+
+    def paths(self, targets: Iterable) -> List[PathResult]:
+        """
+        Odtwarza ścieżki do wielu wierzchołków docelowych.
+
+        Args:
+            targets (Iterable): Identyfikatory wierzchołków docelowych.
+
+        Returns:
+            List[PathResult]: Wyniki w kolejności wierzchołków docelowych.
+        """
+        index = self.nodes.index
+        return [self.path_to_index(index(target)) for target in targets]
+
+    def path_to_index(self, target: int) -> PathResult:
+        """
+        Tworzy wynik dla wierzchołka o podanym indeksie.
+
+        Args:
+            target (int): Indeks wierzchołka docelowego.
+
+        Returns:
+            PathResult: Ścieżka wraz z długością i sumami atrybutów.
+        """
+        cost = self.distances[target]
+        if cost == INF:
+            return PathResult(self.nodes, array("l"), INF, {})
+        totals = {name: values[target] for name, values in self.totals.items()}
+        return PathResult(self.nodes, self.path_indices(target), cost, totals)
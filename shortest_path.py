@@ -8,75 +8,193 @@ Attributes:
     INF (float): Wartość reprezentująca nieskończoność w algorytmach.
 """
 
-from typing import Dict, List, Tuple, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Set
 import heapq
+from array import array
+
+from adjacency import index_adjacency
+from path_result import ShortestPathTree
 
 INF = float('inf')
 
-def dijkstra(graph, start: str, end: str) -> Tuple[float, List[str]]:
+def edge_weight(attributes: Dict, weight: str) -> float:
+    """
+    Zwraca wagę krawędzi dla podanego atrybutu.
+
+    Args:
+        attributes (Dict): Atrybuty krawędzi.
+        weight (str): Nazwa atrybutu używanego jako waga.
+
+    Returns:
+        float: Waga krawędzi lub INF, gdy atrybut nie jest ustawiony.
+    """
+    value = attributes.get(weight)
+    return INF if value is None else float(value)
+
+def dijkstra(graph, start: str, end: Optional[str] = None, weight: str = "distance",
+             max_cost: float = INF, max_hops: Optional[int] = None,
+             targets: Optional[Iterable[str]] = None) -> Tuple[float, List[str]]:
     """
     Implementacja algorytmu Dijkstry do znajdowania najkrótszej ścieżki.
 
+    Stan przeszukiwania tworzony jest leniwie - tylko dla wierzchołków
+    faktycznie osiągniętych - a relaksacja korzysta z sąsiedztwa indeksowego
+    (zob. moduł adjacency), więc nie zamienia indeksów na identyfikatory.
+    Koszt zapytania zależy od przeszukanego obszaru, a nie od rozmiaru grafu.
+    Przeszukiwanie kończy się po rozliczeniu pierwszego wierzchołka docelowego.
+
+    Przy ustawionym ``max_hops`` wierzchołek może zostać rozliczony ponownie,
+    jeśli osiągnięto go mniejszą liczbą krawędzi; wynik jest wtedy najkrótszą
+    ścieżką spośród ścieżek o co najwyżej ``max_hops`` krawędziach.
+
     Args:
-        graph (Dict): Słownik reprezentujący graf w formie list sąsiedztwa.
-        start (int): Wierzchołek początkowy.
-        end (int): Wierzchołek końcowy.
+        graph: Graf udostępniający ``nodes`` (NodeStore) i ``neighbors(node_id)``.
+        start (str): Wierzchołek początkowy.
+        end (str, optional): Wierzchołek końcowy.
+        weight (str, optional): Atrybut krawędzi używany jako waga. Domyślnie "distance".
+        max_cost (float, optional): Maksymalna długość ścieżki; dalsze wierzchołki są pomijane.
+        max_hops (int, optional): Maksymalna liczba krawędzi ścieżki.
+        targets (Iterable[str], optional): Dodatkowe wierzchołki docelowe - zwracana
+            jest ścieżka do najbliższego z nich (ostatni element ścieżki).
 
     Returns:
-        Tuple[List[int], float]: Krotka zawierająca listę wierzchołków tworzących
-            najkrótszą ścieżkę oraz jej długość.
+        Tuple[float, List[str]]: Krotka zawierająca długość najkrótszej ścieżki
+            oraz listę tworzących ją wierzchołków (pustą, gdy ścieżka nie istnieje).
 
     Raises:
-        ValueError: Gdy start lub end nie istnieją w grafie.
+        ValueError: Gdy start lub wierzchołki docelowe nie istnieją w grafie
+            albo nie podano żadnego wierzchołka docelowego.
     """
-    distances = {node: float('inf') for node in graph.nodes}
-    distances[start] = 0
-    previous_nodes = {node: None for node in graph.nodes}
-    visited = set()
-    priority_queue = [(0, start)]
+    nodes = graph.nodes
+    goals = set(targets) if targets is not None else set()
+    if end is not None:
+        goals.add(end)
+    if not goals:
+        raise ValueError("At least one target node is required.")
+    if start not in nodes or any(goal not in nodes for goal in goals):
+        raise ValueError("Both start and end nodes must exist in the graph.")
+    goal_indices = {nodes.index(goal) for goal in goals}
+    adjacency = index_adjacency(graph)
+
+    # Etykiety ścieżek: wierzchołek i etykieta poprzednika, tworzone przy relaksacji
+    label_nodes = [nodes.index(start)]
+    label_parents = [-1]
+    best_distances = {label_nodes[0]: 0.0}
+    settled_hops = {}
+    priority_queue = [(0.0, 0, 0)]
 
     while priority_queue:
-        current_distance, current_node = heapq.heappop(priority_queue)
+        current_distance, hops, label = heapq.heappop(priority_queue)
+        current_index = label_nodes[label]
 
-        if current_node in visited:
+        if current_index in settled_hops and (max_hops is None or settled_hops[current_index] <= hops):
             continue
-        visited.add(current_node)
-
-        if current_node == end:
-            break
-
-        if current_node not in graph.edges:
+        settled_hops[current_index] = hops
+
+        if current_index in goal_indices:
+            # Rekonstrukcja ścieżki
+            path = []
+            while label != -1:
+                path.append(nodes.node_id(label_nodes[label]))
+                label = label_parents[label]
+            path.reverse()
+            return current_distance, path
+
+        if max_hops is not None and hops >= max_hops:
             continue
 
-        for edge in graph.edges[current_node]:
-            neighbor = edge["to"]
-            if neighbor in visited:
+        for neighbor_index, attributes in adjacency[current_index]:
+            # Waga odczytywana w chwili relaksacji (jak w edge_weight), bez wywołania funkcji
+            value = attributes.get(weight)
+            if value is None:
+                continue
+            new_distance = current_distance + value
+            if new_distance == INF or new_distance > max_cost:
                 continue
-                
-            edge_weight = float(edge.get("distance", float('inf')))
-            new_distance = current_distance + edge_weight
 
-            if new_distance < distances[neighbor]:
-                distances[neighbor] = new_distance
-                previous_nodes[neighbor] = current_node
-                heapq.heappush(priority_queue, (new_distance, neighbor))
+            if max_hops is None:
+                if neighbor_index in settled_hops or new_distance >= best_distances.get(neighbor_index, INF):
+                    continue
+                best_distances[neighbor_index] = new_distance
+            elif settled_hops.get(neighbor_index, max_hops + 1) <= hops + 1:
+                continue
 
-    # Rekonstrukcja ścieżki
-    path = []
-    current = end
-    while current:
-        path.append(current)
-        current = previous_nodes[current]
-    path.reverse()
+            label_nodes.append(neighbor_index)
+            label_parents.append(label)
+            heapq.heappush(priority_queue, (new_distance, hops + 1, len(label_nodes) - 1))
+
+    return INF, []
+
+def shortest_path_tree(graph, start: str, weight: str = "distance", max_cost: float = INF,
+                       accumulate: Iterable[str] = ("distance", "time")) -> ShortestPathTree:
+    """
+    Wyznacza drzewo najkrótszych ścieżek z jednego źródła do wszystkich wierzchołków.
+
+    Wynik przechowywany jest w tablicach ``array`` indeksowanych gęstymi
+    indeksami wierzchołków, co pozwala odtwarzać wiele ścieżek zbiorczo
+    (``ShortestPathTree.paths``) bez słowników poprzedników.
+
+    Args:
+        graph: Graf udostępniający ``nodes`` (NodeStore) i ``neighbors(node_id)``.
+        start (str): Wierzchołek początkowy.
+        weight (str, optional): Atrybut krawędzi używany jako waga. Domyślnie "distance".
+        max_cost (float, optional): Maksymalna długość ścieżki; dalsze wierzchołki są pomijane.
+        accumulate (Iterable[str], optional): Atrybuty krawędzi sumowane wzdłuż ścieżek.
+
+    Returns:
+        ShortestPathTree: Drzewo najkrótszych ścieżek.
+
+    Raises:
+        ValueError: Gdy start nie istnieje w grafie.
+    """
+    nodes = graph.nodes
+    if start not in nodes:
+        raise ValueError(f"Node with ID {start} does not exist.")
+
+    capacity = nodes.capacity
+    start_index = nodes.index(start)
+    adjacency = index_adjacency(graph)
+    distances = array("d", [INF]) * capacity
+    predecessors = array("l", [-1]) * capacity
+    depths = array("l", [0]) * capacity
+    totals = {name: array("d", [0.0]) * capacity for name in accumulate}
+    settled = bytearray(capacity)
+    distances[start_index] = 0
+    priority_queue = [(0, start_index)]
+
+    while priority_queue:
+        current_distance, current_index = heapq.heappop(priority_queue)
+        if settled[current_index]:
+            continue
+        settled[current_index] = 1
 
-    return distances[end], path if distances[end] != float('inf') else []
+        parent = predecessors[current_index]
+        if parent != -1:
+            depths[current_index] = depths[parent] + 1
+
+        for neighbor_index, attributes in adjacency[current_index]:
+            if settled[neighbor_index]:
+                continue
+            new_distance = current_distance + edge_weight(attributes, weight)
+            if new_distance > max_cost:
+                continue
+            if new_distance < distances[neighbor_index]:
+                distances[neighbor_index] = new_distance
+                predecessors[neighbor_index] = current_index
+                for name, values in totals.items():
+                    value = attributes.get(name)
+                    values[neighbor_index] = values[current_index] + (0.0 if value is None else float(value))
+                heapq.heappush(priority_queue, (new_distance, neighbor_index))
+
+    return ShortestPathTree(nodes, start_index, predecessors, distances, depths, totals)
 
 def find_path(prev: Dict[int, int], start: int, end: int) -> List[int]:
     """
     Odtwarza ścieżkę na podstawie słownika poprzedników.
 
     Args:
-        prev (Dict[int, int]): Słownik poprzedników dla każdego wierzchołka.
+        prev (Dict[int, int]): Słownik poprzedników dla każdego wierzchołka
+            (None dla wierzchołka początkowego).
         start (int): Wierzchołek początkowy.
         end (int): Wierzchołek końcowy.
 
@@ -85,8 +203,11 @@ def find_path(prev: Dict[int, int], start: int, end: int) -> List[int]:
     """
     path = []
     current = end
-    while current:
+    # Porównanie z None - identyfikatory takie jak 0 lub "" są poprawne
+    while current is not None:
         path.append(current)
+        if current == start:
+            break
         current = prev[current]
     path.reverse()
     return path
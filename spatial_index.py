@@ -0,0 +1,191 @@
+"""
+Moduł implementujący indeks przestrzenny wierzchołków grafu.
+
+Ten moduł zawiera klasę KDTree - dwuwymiarowe drzewo k-d zbudowane na
+współrzędnych wierzchołków. Umożliwia wyszukiwanie najbliższego
+wierzchołka, k najbliższych wierzchołków oraz wierzchołków leżących
+w zadanym prostokącie w czasie logarytmicznym względem liczby punktów.
+
+Drzewo jest strukturą statyczną - po zmianie współrzędnych w grafie
+należy zbudować je ponownie.
+
+Example:
+    >>> graph = Graph()
+    >>> graph.add_node("WAW", "airport", "Warszawa", coords=(21.0, 52.2))
+    >>> graph.add_node("KRK", "airport", "Kraków", coords=(19.9, 50.1))
+    >>> index = build_spatial_index(graph)
+    >>> index.nearest(20.0, 50.0)
+    'KRK'
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class KDTree:
+    """
+    Klasa reprezentująca dwuwymiarowe drzewo k-d.
+
+    Drzewo przechowywane jest w płaskich listach: wierzchołek drzewa o indeksie
+    ``i`` ma punkt ``(xs[i], ys[i])`` i identyfikator ``ids[i]``, a jego
+    poddrzewa zaczynają się w ``left[i]`` i ``right[i]`` (-1 oznacza brak).
+
+    Attributes:
+        ids (list): Identyfikatory wierzchołków grafu.
+        xs (list): Współrzędne x.
+        ys (list): Współrzędne y.
+        left (list): Indeksy lewych poddrzew.
+        right (list): Indeksy prawych poddrzew.
+        root (int): Indeks korzenia lub -1 dla pustego drzewa.
+    """
+
+    def __init__(self, points: Dict[Any, Tuple[float, float]]):
+        """
+        Buduje drzewo z podanych punktów.
+
+        Args:
+            points (Dict[Any, Tuple[float, float]]): Słownik identyfikator -> (x, y).
+        """
+        self.ids = []
+        self.xs = []
+        self.ys = []
+        self.left = []
+        self.right = []
+        items = [(float(x), float(y), node_id) for node_id, (x, y) in points.items()]
+        self.root = self._build(items, 0)
+
+    def __len__(self) -> int:
+        """
+        Zwraca liczbę punktów w drzewie.
+
+        Returns:
+            int: Liczba punktów.
+        """
+        return len(self.ids)
+
+    def _build(self, items: List[Tuple[float, float, Any]], depth: int) -> int:
+        """
+        Rekurencyjnie buduje poddrzewo dzieląc punkty względem mediany.
+
+        Args:
+            items (List[Tuple[float, float, Any]]): Punkty poddrzewa.
+            depth (int): Głębokość poddrzewa (wyznacza oś podziału).
+
+        Returns:
+            int: Indeks korzenia poddrzewa lub -1.
+        """
+        if not items:
+            return -1
+        axis = depth % 2
+        items.sort(key=lambda item: item[axis])
+        median = len(items) // 2
+        x, y, node_id = items[median]
+
+        index = len(self.ids)
+        self.ids.append(node_id)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.left.append(-1)
+        self.right.append(-1)
+
+        self.left[index] = self._build(items[:median], depth + 1)
+        self.right[index] = self._build(items[median + 1:], depth + 1)
+        return index
+
+    def nearest(self, x: float, y: float) -> Optional[Any]:
+        """
+        Znajduje wierzchołek najbliższy podanemu punktowi.
+
+        Args:
+            x (float): Współrzędna x.
+            y (float): Współrzędna y.
+
+        Returns:
+            Optional[Any]: Identyfikator wierzchołka lub None dla pustego drzewa.
+        """
+        result = self.k_nearest(x, y, 1)
+        return result[0] if result else None
+
+    def k_nearest(self, x: float, y: float, k: int) -> List[Any]:
+        """
+        Znajduje k wierzchołków najbliższych podanemu punktowi.
+
+        Args:
+            x (float): Współrzędna x.
+            y (float): Współrzędna y.
+            k (int): Liczba szukanych wierzchołków.
+
+        Returns:
+            List[Any]: Identyfikatory wierzchołków posortowane rosnąco według odległości.
+        """
+        if k <= 0 or self.root == -1:
+            return []
+        # Kopiec maksymalny (przez ujemne odległości) k najlepszych kandydatów
+        best = []
+        stack = [(self.root, 0)]
+        while stack:
+            index, depth = stack.pop()
+            if index == -1:
+                continue
+            dx = x - self.xs[index]
+            dy = y - self.ys[index]
+            dist = dx * dx + dy * dy
+            if len(best) < k:
+                heapq.heappush(best, (-dist, -index))
+            elif dist < -best[0][0]:
+                heapq.heapreplace(best, (-dist, -index))
+
+            diff = dx if depth % 2 == 0 else dy
+            near, far = (self.left[index], self.right[index]) if diff < 0 else (self.right[index], self.left[index])
+            # Dalsze poddrzewo odwiedzamy tylko, gdy płaszczyzna podziału jest bliżej niż najgorszy kandydat
+            if len(best) < k or diff * diff < -best[0][0]:
+                stack.append((far, depth + 1))
+            stack.append((near, depth + 1))
+
+        best.sort(key=lambda item: (-item[0], -item[1]))
+        return [self.ids[-index] for _, index in best]
+
+    def within_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Any]:
+        """
+        Znajduje wierzchołki leżące w prostokącie (włącznie z brzegami).
+
+        Args:
+            min_x (float): Lewa granica prostokąta.
+            min_y (float): Dolna granica prostokąta.
+            max_x (float): Prawa granica prostokąta.
+            max_y (float): Górna granica prostokąta.
+
+        Returns:
+            List[Any]: Identyfikatory wierzchołków w prostokącie.
+        """
+        result = []
+        stack = [(self.root, 0)]
+        while stack:
+            index, depth = stack.pop()
+            if index == -1:
+                continue
+            x, y = self.xs[index], self.ys[index]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                result.append(self.ids[index])
+            if depth % 2 == 0:
+                low, high, value = min_x, max_x, x
+            else:
+                low, high, value = min_y, max_y, y
+            if low <= value:
+                stack.append((self.left[index], depth + 1))
+            if value <= high:
+                stack.append((self.right[index], depth + 1))
+        return result
+
+
+def build_spatial_index(graph) -> KDTree:
+    """
+    Buduje indeks przestrzenny dla wierzchołków grafu posiadających współrzędne.
+
+    Args:
+        graph: Graf z atrybutem ``coordinates`` (słownik identyfikator -> (x, y)).
+
+    Returns:
+        KDTree: Drzewo k-d zbudowane na współrzędnych wierzchołków.
+    """
+    return KDTree(graph.coordinates)
@@ -0,0 +1,110 @@
+"""
+Moduł testów dla sąsiedztwa indeksowego.
+
+Ten moduł zawiera testy jednostkowe sprawdzające wyliczanie sąsiedztwa
+indeksowego oraz jego unieważnianie po zmianach grafu.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from adjacency import index_adjacency
+from graph import Graph
+from graph_view import GraphView
+from shortest_path import dijkstra, shortest_path_tree
+
+
+def _triangle():
+    graph = Graph()
+    graph.add_node("A", "city", "Warszawa")
+    graph.add_node("B", "city", "Kraków")
+    graph.add_node("C", "city", "Gdańsk")
+    graph.add_edge("A", "B", distance=300, time=45)
+    graph.add_edge("A", "C", distance=350)
+    graph.add_edge("C", "B", distance=10)
+    return graph
+
+
+def test_index_adjacency_layout():
+    """
+    Test sąsiedztwa indeksowego.
+
+    Sprawdza czy:
+    - Sąsiedzi są indeksami wierzchołków, a atrybuty słownikami krawędzi grafu
+    - Listy wyliczane są tylko dla odwiedzanych wierzchołków
+    - Graf przechowuje jedno sąsiedztwo niezależnie od atrybutu wagi
+    """
+    graph = _triangle()
+    nodes = graph.nodes
+    adjacency = index_adjacency(graph)
+    assert adjacency == {}
+    assert sorted(neighbor for neighbor, _ in adjacency[nodes.index("A")]) == sorted(
+        [nodes.index("B"), nodes.index("C")]
+    )
+    assert dict(adjacency[nodes.index("A")])[nodes.index("B")] is graph.edges["A"]["B"]
+    assert list(adjacency) == [nodes.index("A")]
+    dijkstra(graph, "A", "B", weight="time")
+    assert index_adjacency(graph) is adjacency
+
+
+def test_weights_are_read_live():
+    """
+    Test zmiany wagi bezpośrednio w słowniku atrybutów krawędzi.
+    """
+    graph = _triangle()
+    assert dijkstra(graph, "A", "B") == (300, ["A", "B"])
+    graph.edges["A"]["B"]["distance"] = 1000
+    assert dijkstra(graph, "A", "B") == (360, ["A", "C", "B"])
+    result = shortest_path_tree(graph, "A").paths(["B"])[0]
+    assert result.cost == 360
+    assert result.totals["distance"] == 360
+
+
+def test_mutation_invalidates_only_changed_nodes():
+    """
+    Test unieważniania sąsiedztwa po zmianach grafu.
+
+    Sprawdza czy zmiana unieważnia jedynie listy zmienionych wierzchołków,
+    a wyniki zapytań uwzględniają zmiany.
+    """
+    graph = _triangle()
+    nodes = graph.nodes
+    adjacency = index_adjacency(graph)
+    assert dijkstra(graph, "A", "B") == (300, ["A", "B"])
+    assert dijkstra(graph, "C", "B") == (10, ["C", "B"])
+    graph.add_edge("A", "C", distance=1)
+    assert set(adjacency) == {nodes.index("C")}
+    assert dijkstra(graph, "A", "B") == (11, ["A", "C", "B"])
+    graph.remove_edge("C", "B")
+    assert dijkstra(graph, "A", "B") == (300, ["A", "B"])
+    graph.add_node("D", "city", "Poznań")
+    graph.add_edge("D", "A", distance=5)
+    assert dijkstra(graph, "D", "B") == (305, ["D", "A", "B"])
+    graph.remove_node("A")
+    assert dijkstra(graph, "D", "B") == (float("inf"), [])
+    assert index_adjacency(graph) is adjacency
+
+
+def test_edge_to_missing_node_is_not_cached():
+    """
+    Test krawędzi do wierzchołka dodanego po pierwszym zapytaniu.
+    """
+    graph = _triangle()
+    graph.add_edge("B", "X", distance=1)
+    assert dijkstra(graph, "B", "A") == (float("inf"), [])
+    graph.add_node("X", "city", "Łódź")
+    assert dijkstra(graph, "A", "X") == (301, ["A", "B", "X"])
+
+
+def test_view_adjacency_is_per_query():
+    """
+    Test sąsiedztwa widoku wyliczanego tylko dla odwiedzanych wierzchołków.
+    """
+    graph = _triangle()
+    view = GraphView(graph, exclude_nodes={"C"})
+    adjacency = index_adjacency(view)
+    assert adjacency is not index_adjacency(view)
+    assert [neighbor for neighbor, _ in adjacency[graph.nodes.index("A")]] == [graph.nodes.index("B")]
+    assert list(adjacency) == [graph.nodes.index("A")]
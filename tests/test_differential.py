@@ -0,0 +1,112 @@
+"""
+Moduł testów różnicowych dla algorytmów najkrótszej ścieżki.
+
+Ten moduł uruchamia harness z modułu differential na wielu losowych
+grafach i sprawdza, czy wszystkie implementacje zgadzają się z wynikiem
+referencyjnym.
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from differential import (
+    IMPLEMENTATIONS, SHAPES, CaseResult, random_graph, run_case, run_differential,
+    slow_implementations,
+)
+from shortest_path import dijkstra
+
+
+def test_all_implementations_agree():
+    """
+    Test zgodności wszystkich implementacji z wynikiem referencyjnym.
+
+    Sprawdza czy:
+    - Żaden przypadek nie zawiera niezgodności
+    - Dla każdej implementacji zmierzono czas
+    """
+    for seed in range(3):
+        for result in run_differential(sizes=(1, 8, 40), seed=seed, queries=15):
+            assert result.mismatches == [], result
+            for name in IMPLEMENTATIONS:
+                assert f"{name}/graph" in result.timings
+                assert f"{name}/view" in result.timings
+
+
+def test_graph_ui_backend_is_covered():
+    """
+    Test uruchamiania implementacji na reprezentacji graph_UI.Graph.
+
+    Pomijany, gdy biblioteki interfejsu graficznego nie są zainstalowane.
+    """
+    pytest.importorskip("tkinter")
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("networkx")
+    for result in run_differential(sizes=(8, 40), queries=10):
+        assert result.mismatches == [], result
+        assert "graph_ui" not in {name for name, _ in result.skipped}
+        for name in IMPLEMENTATIONS:
+            assert f"{name}/graph_ui" in result.timings
+
+
+def test_no_implementation_is_much_slower_than_dijkstra():
+    """
+    Test wydajności względem algorytmu Dijkstry na tym samym grafie.
+
+    Sprawdza czy żadna implementacja ani reprezentacja nie przekracza
+    wielokrotności czasu ``dijkstra/graph`` dla tego samego przypadku.
+    """
+    for result in run_differential(sizes=(300,), seed=1, queries=40):
+        assert slow_implementations(result) == [], result
+
+
+def test_slow_implementation_is_reported():
+    """
+    Test wykrywania implementacji wolniejszej od implementacji bazowej.
+    """
+    result = CaseResult("grid", 10, 0)
+    result.timings = {"dijkstra/graph": 0.01, "alt/graph": 0.02, "alt/view": 0.9}
+    assert slow_implementations(result, factor=50) == [("alt/view", 90.0)]
+    result.timings = {"dijkstra/graph": 0.0001, "alt/graph": 0.002}
+    assert slow_implementations(result, factor=10) == []
+
+
+def test_harness_detects_wrong_results():
+    """
+    Test wykrywania błędnej implementacji.
+
+    Sprawdza czy harness zgłasza implementację zwracającą złą odległość
+    oraz ścieżkę niezgodną z podaną długością.
+    """
+    def off_by_one(graph):
+        def query(start, end):
+            distance, path = dijkstra(graph, start, end)
+            return (distance + 1, path) if path else (distance, path)
+        return query
+
+    def wrong_path(graph):
+        def query(start, end):
+            distance, path = dijkstra(graph, start, end)
+            return distance, path[:1]
+        return query
+
+    graph = random_graph(20, "grid", seed=4)
+    pairs = [(0, 19), (5, 5)]
+    result = run_case(graph, pairs, CaseResult("grid", 20, 4),
+                      implementations={"off_by_one": off_by_one, "wrong_path": wrong_path},
+                      backends={"graph": lambda g: g})
+    names = {mismatch[0] for mismatch in result.mismatches}
+    assert names == {"off_by_one/graph", "wrong_path/graph"}
+
+
+def test_shapes_are_generated():
+    """
+    Test generatora grafów dla wszystkich kształtów.
+    """
+    for shape in SHAPES:
+        graph = random_graph(25, shape, seed=1)
+        assert len(graph.nodes) == 25
+        assert 0 in graph.nodes
@@ -0,0 +1,117 @@
+"""
+Moduł testów dla grafu używanego przez interfejs graficzny.
+
+Ten moduł zawiera testy jednostkowe sprawdzające rejestrowanie zmian
+oraz przyrostowy zapis i odczyt grafu z modułu graph_UI. Testy są
+pomijane, gdy biblioteki interfejsu graficznego nie są zainstalowane.
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+pytest.importorskip("tkinter")
+pytest.importorskip("matplotlib")
+pytest.importorskip("networkx")
+
+from graph_UI import Graph
+
+
+def _journal_lines(path):
+    with open(path + ".journal", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_changes_are_recorded():
+    """
+    Test rejestrowania zmian przez operacje na grafie.
+
+    Sprawdza czy wpisy dodania węzła zawierają współrzędne tylko wtedy,
+    gdy zostały podane.
+    """
+    graph = Graph()
+    graph.add_node("A", "city", "Warszawa")
+    graph.add_node("B", "city", "Kraków", coords=(19.9, 50.1))
+    graph.add_edge("A", "B", distance=300, time=45)
+    graph.remove_edge("A", "B")
+    graph.remove_node("B")
+    assert graph._changes == [
+        ["add_node", "A", "city", "Warszawa"],
+        ["add_node", "B", "city", "Kraków", [19.9, 50.1]],
+        ["add_edge", "A", "B", {"distance": 300, "time": 45}],
+        ["remove_edge", "A", "B"],
+        ["remove_node", "B"],
+    ]
+
+
+def test_save_and_load_incrementally(tmp_path):
+    """
+    Test przyrostowego zapisu i odczytu grafu.
+
+    Sprawdza czy:
+    - Pierwszy zapis tworzy migawkę z pustym dziennikiem
+    - Kolejny zapis dopisuje tylko zmiany do dziennika
+    - Wczytany graf odpowiada zapisanemu
+    """
+    path = str(tmp_path / "graph.json")
+    graph = Graph()
+    graph.add_node("A", "city", "Warszawa")
+    graph.save_to_file(path)
+    snapshot = open(path, encoding="utf-8").read()
+    assert len(_journal_lines(path)) == 1
+
+    graph.add_node("B", "city", "Kraków", coords=(19.9, 50.1))
+    graph.add_edge("A", "B", distance=300, time=45)
+    graph.save_to_file(path)
+    assert open(path, encoding="utf-8").read() == snapshot
+    assert len(_journal_lines(path)) == 3
+
+    loaded = Graph()
+    loaded.load_from_file(path)
+    assert loaded.to_json() == graph.to_json()
+    assert loaded._changes == []
+
+
+def test_save_compacts_after_threshold(tmp_path):
+    """
+    Test kompaktowania dziennika przy zapisie po przekroczeniu progu.
+    """
+    path = str(tmp_path / "graph.json")
+    graph = Graph()
+    graph.save_to_file(path)
+    graph._journal.compact_threshold = 2
+    graph.add_node("A", "city", "Warszawa")
+    graph.add_node("B", "city", "Kraków")
+    graph.save_to_file(path)
+
+    assert _journal_lines(path) == [{"snapshot_id": graph._journal.snapshot_id}]
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)["nodes"]) == 2
+
+
+def test_snapshot_without_id_is_compacted_on_save(tmp_path):
+    """
+    Test zapisu grafu wczytanego z pliku bez identyfikatora migawki.
+
+    Sprawdza czy pierwszy zapis tworzy pełną migawkę, a dziennik pozostały
+    po poprzednim pliku nie jest odtwarzany po podmianie pliku grafu.
+    """
+    path = str(tmp_path / "graph.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"nodes": [{"id": "A", "type": "city", "name": "Warszawa"}], "edges": []}, f)
+    graph = Graph()
+    graph.load_from_file(path)
+    graph.add_node("B", "city", "Kraków")
+    graph.save_to_file(path)
+    with open(path, encoding="utf-8") as f:
+        assert f.read().count('"B"') == 1
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"nodes": [{"id": "B", "type": "city", "name": "Kraków"}], "edges": []}, f)
+    replaced = Graph()
+    replaced.load_from_file(path)
+    assert list(replaced.nodes) == ["B"]
@@ -0,0 +1,145 @@
+"""
+Moduł testów dla przyrostowego zapisu grafu.
+
+Ten moduł zawiera testy jednostkowe sprawdzające zapis migawki,
+dopisywanie zmian do dziennika oraz odtwarzanie stanu po awarii.
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph import Graph
+from graph_journal import GraphJournal, apply_change
+
+
+def _replay(journal):
+    """Wczytuje migawkę i dziennik, zwracając odtworzony graf."""
+    data, changes = journal.load()
+    graph = Graph()
+    for node in data["nodes"]:
+        graph.add_node(node["id"], node["type"], node["name"])
+    for edge in data["edges"]:
+        graph.add_edge(edge["from"], edge["to"], distance=edge.get("distance"), time=edge.get("time"))
+    for change in changes:
+        apply_change(graph, change)
+    return graph
+
+
+def test_append_and_load(tmp_path):
+    """
+    Test dopisywania zmian i ich odtwarzania.
+
+    Sprawdza czy:
+    - Migawka nie jest modyfikowana przy dopisywaniu zmian
+    - Zmiany z dziennika są odtwarzane po wczytaniu
+    """
+    path = str(tmp_path / "graph.json")
+    journal = GraphJournal(path)
+    journal.compact({
+        "nodes": [{"id": "A", "type": "city", "name": "Warszawa"}, {"id": "C", "type": "city", "name": "Gdańsk"}],
+        "edges": [{"from": "A", "to": "C", "distance": 350, "time": 55}],
+    })
+    snapshot_before = open(path, encoding="utf-8").read()
+
+    journal.append([
+        ["add_node", "B", "city", "Kraków"],
+        ["add_edge", "A", "B", {"distance": 300, "time": 45}],
+    ])
+
+    assert open(path, encoding="utf-8").read() == snapshot_before
+    graph = _replay(GraphJournal(path))
+    assert set(graph.nodes) == {"A", "B", "C"}
+    assert graph.edges["A"]["B"]["distance"] == 300
+    assert graph.edges["A"]["C"]["distance"] == 350
+
+
+def test_torn_entry_is_discarded(tmp_path):
+    """
+    Test odrzucania niedokończonego wpisu dziennika.
+
+    Sprawdza czy:
+    - Przerwany ostatni wpis jest pomijany
+    - Kolejne dopisywanie daje poprawny dziennik
+    """
+    path = str(tmp_path / "graph.json")
+    journal = GraphJournal(path)
+    journal.compact({"nodes": [], "edges": []})
+    journal.append([["add_node", "A", "city", "Warszawa"]])
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('["add_node", "B", "ci')
+
+    recovered = GraphJournal(path)
+    graph = _replay(recovered)
+    assert set(graph.nodes) == {"A"}
+
+    recovered.append([["add_node", "C", "city", "Gdańsk"]])
+    graph = _replay(GraphJournal(path))
+    assert set(graph.nodes) == {"A", "C"}
+
+
+def test_stale_journal_is_ignored(tmp_path):
+    """
+    Test pomijania dziennika należącego do poprzedniej migawki.
+
+    Symuluje awarię po zapisaniu nowej migawki, a przed wyczyszczeniem dziennika.
+    """
+    path = str(tmp_path / "graph.json")
+    journal = GraphJournal(path)
+    journal.compact({"nodes": [], "edges": []})
+    journal.append([["add_node", "A", "city", "Warszawa"]])
+    stale = open(journal.journal_path, encoding="utf-8").read()
+
+    journal.compact({"nodes": [{"id": "A", "type": "city", "name": "Warszawa"}], "edges": []})
+    with open(journal.journal_path, "w", encoding="utf-8") as f:
+        f.write(stale)
+
+    graph = _replay(GraphJournal(path))
+    assert set(graph.nodes) == {"A"}
+
+
+def test_compaction_threshold(tmp_path):
+    """
+    Test progu kompaktowania dziennika.
+
+    Sprawdza czy po kompaktowaniu dziennik jest pusty, a migawka zawiera dane.
+    """
+    path = str(tmp_path / "graph.json")
+    journal = GraphJournal(path, compact_threshold=2)
+    journal.compact({"nodes": [], "edges": []})
+    journal.append([["add_node", "A", "city", "Warszawa"]])
+    assert not journal.needs_compaction()
+    journal.append([["add_node", "B", "city", "Kraków"]])
+    assert journal.needs_compaction()
+
+    journal.compact({"nodes": [{"id": "A", "type": "city", "name": "Warszawa"}], "edges": []})
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["snapshot_id"] == journal.snapshot_id
+    data, changes = GraphJournal(path).load()
+    assert changes == []
+    assert len(data["nodes"]) == 1
+
+
+def test_snapshot_without_id_ignores_journal(tmp_path):
+    """
+    Test migawki bez identyfikatora (zapisanej ręcznie lub starszą wersją).
+
+    Sprawdza czy:
+    - Dziennik z nagłówkiem bez identyfikatora nie jest odtwarzany
+    - Plik dziennika nie jest modyfikowany przy wczytywaniu
+    """
+    path = str(tmp_path / "graph.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"nodes": [{"id": "B", "type": "city", "name": "Kraków"}], "edges": []}, f)
+    journal_path = path + ".journal"
+    with open(journal_path, "w", encoding="utf-8") as f:
+        f.write('{"snapshot_id": null}\n["add_node", "B", "city", "Kraków"]\n')
+
+    journal = GraphJournal(path)
+    data, changes = journal.load()
+    assert journal.snapshot_id is None
+    assert changes == []
+    assert len(data["nodes"]) == 1
+    assert open(journal_path, encoding="utf-8").read().startswith('{"snapshot_id": null}')
@@ -0,0 +1,66 @@
+"""
+Moduł testów dla filtrowanych widoków grafu.
+
+Ten moduł zawiera testy jednostkowe sprawdzające filtrowanie wierzchołków
+i krawędzi oraz wyszukiwanie ścieżek bezpośrednio na widoku.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph import Graph
+from graph_view import GraphView
+from shortest_path import dijkstra
+
+
+def _mixed_graph():
+    """
+    Tworzy graf lotnisk z przystankiem autobusowym jako skrótem.
+    """
+    graph = Graph()
+    graph.add_node("WAW", "airport", "Warszawa")
+    graph.add_node("KRK", "airport", "Kraków")
+    graph.add_node("GDN", "airport", "Gdańsk")
+    graph.add_node("BUS", "bus_stop", "Dworzec")
+    graph.add_edge("WAW", "BUS", distance=10, time=5)
+    graph.add_edge("BUS", "KRK", distance=10, time=300)
+    graph.add_edge("WAW", "GDN", distance=350, time=55)
+    graph.add_edge("GDN", "KRK", distance=600, time=90)
+    graph.add_edge("WAW", "KRK", distance=300, time=45)
+    return graph
+
+
+def test_node_type_filter():
+    """
+    Test widoku ograniczonego do typu wierzchołków.
+
+    Sprawdza czy:
+    - Wierzchołki innego typu są niewidoczne
+    - Dijkstra na widoku omija te wierzchołki
+    """
+    graph = _mixed_graph()
+    airports = GraphView(graph, node_types={"airport"})
+    assert "BUS" not in airports.nodes
+    assert set(airports.nodes) == {"WAW", "KRK", "GDN"}
+    assert dijkstra(graph, "WAW", "KRK") == (20, ["WAW", "BUS", "KRK"])
+    assert dijkstra(airports, "WAW", "KRK") == (300, ["WAW", "KRK"])
+
+
+def test_edge_filter_and_exclusions():
+    """
+    Test filtrowania krawędzi oraz wykluczonych wierzchołków i krawędzi.
+
+    Sprawdza również, że zmiany w grafie są widoczne w widoku bez jego odtwarzania.
+    """
+    graph = _mixed_graph()
+    quick = GraphView(graph, edge_filter=lambda a, b, edge: edge["time"] < 100)
+    assert dijkstra(quick, "WAW", "KRK") == (300, ["WAW", "KRK"])
+
+    closed = GraphView(quick, exclude_edges={("WAW", "KRK")})
+    assert dijkstra(closed, "WAW", "KRK") == (950, ["WAW", "GDN", "KRK"])
+    assert dijkstra(GraphView(closed, exclude_nodes={"GDN"}), "WAW", "KRK") == (float("inf"), [])
+
+    graph.add_edge("GDN", "KRK", distance=100, time=20)
+    assert dijkstra(closed, "WAW", "KRK") == (450, ["WAW", "GDN", "KRK"])
@@ -12,7 +12,7 @@ import json
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from graph import Graph
-from json_loader import load_graph_from_json
+from json_loader import load_graph_from_json, load_graph_from_shards
 
 
 def test_load_graph_from_json():
@@ -53,3 +53,72 @@ def test_load_graph_from_json():
     assert graph.edges["A"]["B"]["time"] == 6
 
     os.remove("test_network.json")
+
+
+def _write_shard(directory, name, nodes, edges):
+    path = directory / name
+    path.write_text(json.dumps({"nodes": nodes, "edges": edges}), encoding="utf-8")
+    return str(path)
+
+
+def test_load_graph_from_shards(tmp_path):
+    """
+    Test równoległego wczytywania i łączenia fragmentów grafu.
+
+    Sprawdza czy:
+    - Krawędzie między fragmentami łączą wierzchołki z różnych plików
+    - Identyczne powtórzenia są liczone, a odmienne zgłaszane jako konflikty
+    - Krawędzie do nieistniejących wierzchołków są pomijane i raportowane
+    """
+    north = _write_shard(tmp_path, "north.json", [
+        {"id": "GDN", "type": "airport", "name": "Gdańsk"},
+        {"id": "WAW", "type": "airport", "name": "Warszawa"},
+    ], [
+        {"from": "WAW", "to": "GDN", "distance": 350, "time": 55},
+    ])
+    south = _write_shard(tmp_path, "south.json", [
+        {"id": "KRK", "type": "airport", "name": "Kraków", "x": 19.9, "y": 50.1},
+        {"id": "WAW", "type": "airport", "name": "Warszawa"},
+        {"id": "GDN", "type": "airport", "name": "Gdansk"},
+    ], [
+        {"from": "WAW", "to": "KRK", "distance": 300, "time": 45},
+        {"from": "WAW", "to": "GDN", "distance": 340, "time": 50},
+        {"from": "KRK", "to": "WRO", "distance": 270, "time": 40},
+    ])
+
+    graph, report = load_graph_from_shards([north, south], max_workers=2)
+
+    assert set(graph.nodes) == {"GDN", "WAW", "KRK"}
+    assert graph.nodes["GDN"]["name"] == "Gdańsk"
+    assert graph.coordinates["KRK"] == (19.9, 50.1)
+    assert graph.edges["WAW"]["KRK"]["distance"] == 300
+    assert graph.edges["WAW"]["GDN"]["distance"] == 350
+
+    assert report.duplicate_nodes == 1
+    assert report.node_conflicts == [("GDN", north, south)]
+    assert report.edge_conflicts == [("WAW", "GDN", north, south)]
+    assert report.dangling_edges == [("KRK", "WRO", south)]
+    assert report.has_conflicts
+
+
+def test_load_graph_from_json_replays_journal(tmp_path):
+    """
+    Test wczytywania grafu zapisanego przyrostowo (migawka + dziennik).
+    """
+    from graph_journal import GraphJournal
+
+    path = str(tmp_path / "graph.json")
+    journal = GraphJournal(path)
+    journal.compact({
+        "nodes": [{"id": "A", "type": "city", "name": "Warszawa"}],
+        "edges": [],
+    })
+    journal.append([
+        ["add_node", "B", "city", "Kraków", [19.9, 50.1]],
+        ["add_edge", "A", "B", {"distance": 300, "time": 45}],
+    ])
+
+    graph = load_graph_from_json(path)
+    assert set(graph.nodes) == {"A", "B"}
+    assert graph.edges["A"]["B"] == {"distance": 300, "time": 45}
+    assert graph.coordinates["B"] == (19.9, 50.1)
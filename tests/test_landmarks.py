@@ -0,0 +1,71 @@
+"""
+Moduł testów dla wyszukiwania ALT.
+
+Ten moduł zawiera testy jednostkowe sprawdzające poprawność ograniczeń
+dolnych, zgodność wyników z algorytmem Dijkstry oraz zapis tablic.
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from differential import random_graph
+from landmarks import alt_search, build_landmarks, load_landmarks
+from shortest_path import dijkstra
+
+
+def test_alt_matches_dijkstra_with_fewer_settled_nodes():
+    """
+    Test zgodności ALT z algorytmem Dijkstry.
+
+    Sprawdza czy:
+    - Długości ścieżek są identyczne
+    - ALT rozlicza łącznie wyraźnie mniej wierzchołków
+    """
+    graph = random_graph(144, "grid", seed=5)
+    table = build_landmarks(graph, count=4)
+    rng = random.Random(11)
+    nodes = list(graph.nodes)
+    alt_settled = plain_settled = 0
+    for _ in range(30):
+        start, end = rng.choice(nodes), rng.choice(nodes)
+        alt_stats, plain_stats = {}, {}
+        distance, path = alt_search(graph, start, end, table, stats=alt_stats)
+        assert distance == dijkstra(graph, start, end)[0]
+        assert alt_search(graph, start, end, None, stats=plain_stats)[0] == distance
+        assert path[0] == start and path[-1] == end
+        alt_settled += alt_stats["settled"]
+        plain_settled += plain_stats["settled"]
+    assert alt_settled * 2 < plain_settled
+
+
+def test_unreachable_target():
+    """
+    Test nieosiągalnego celu.
+
+    Sprawdza czy ograniczenie dolne wykrywa brak ścieżki bez przeszukiwania.
+    """
+    graph = random_graph(16, "grid", seed=5)
+    graph.add_node("X", "bus_stop", "Odizolowany")
+    graph.add_edge("X", 0, distance=1)
+    table = build_landmarks(graph, count=2)
+    stats = {}
+    assert alt_search(graph, 0, "X", table, stats=stats) == (float("inf"), [])
+    assert stats["settled"] == 0
+    assert alt_search(graph, "X", 15, table)[0] == dijkstra(graph, "X", 15)[0]
+
+
+def test_save_and_load(tmp_path):
+    """
+    Test zapisu i odczytu tablic punktów orientacyjnych.
+    """
+    graph = random_graph(25, "grid", seed=5)
+    table = build_landmarks(graph, count=3)
+    path = str(tmp_path / "graph.landmarks")
+    table.save(path)
+    loaded = load_landmarks(graph, path)
+    assert loaded.landmarks == table.landmarks
+    assert list(loaded.forward[0]) == list(table.forward[0])
+    assert list(loaded.backward[2]) == list(table.backward[2])
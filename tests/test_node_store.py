@@ -0,0 +1,63 @@
+"""
+Moduł testów dla kolumnowego magazynu wierzchołków.
+
+Ten moduł zawiera testy jednostkowe sprawdzające odwzorowanie
+identyfikatorów na indeksy oraz internowanie atrybutów.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph import Graph
+from node_store import NodeStore
+
+
+def test_index_mapping():
+    """
+    Test odwzorowania identyfikator <-> indeks.
+
+    Sprawdza czy:
+    - Indeksy są gęste i nadawane w kolejności dodawania
+    - Indeks usuniętego wierzchołka jest ponownie wykorzystywany
+    """
+    store = NodeStore()
+    assert store.add("WAW", "airport", "Warszawa") == 0
+    assert store.add("KRK", "airport", "Kraków") == 1
+    assert store.node_id(1) == "KRK"
+
+    del store["WAW"]
+    assert "WAW" not in store
+    assert store.add("GDN", "airport", "Gdańsk") == 0
+    assert store.capacity == 2
+    assert len(store) == 2
+
+
+def test_types_are_shared():
+    """
+    Test współdzielenia typów wierzchołków.
+
+    Sprawdza czy powtarzający się typ jest przechowywany tylko raz.
+    """
+    store = NodeStore()
+    for i in range(100):
+        store.add(f"N{i}", "airport", f"Lotnisko {i}")
+    store.add("S", "bus_stop", "Przystanek")
+    assert store.types == ["airport", "bus_stop"]
+    assert store.type_of("N5") == "airport"
+    assert store.name_of("S") == "Przystanek"
+
+
+def test_mapping_interface():
+    """
+    Test zgodności z interfejsem słownika używanym przez Graph.
+
+    Sprawdza czy nadpisanie wierzchołka zmienia jego atrybuty, a nie indeks.
+    """
+    graph = Graph()
+    graph.add_node("A", "bus_stop", "Przystanek A")
+    index = graph.nodes.index("A")
+    graph.add_node("A", "tram_stop", "Przystanek A2")
+    assert graph.nodes.index("A") == index
+    assert dict(graph.nodes) == {"A": {"type": "tram_stop", "name": "Przystanek A2"}}
@@ -0,0 +1,136 @@
+"""
+Moduł testów dla podziału grafu na komórki.
+
+Ten moduł zawiera testy jednostkowe porównujące zapytania z nakładką
+z algorytmem Dijkstry na całym grafie.
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from differential import random_graph
+from graph import Graph
+from partition import partition_graph, load_partition
+from shortest_path import dijkstra
+
+
+def _path_cost(graph, path, weight="distance"):
+    return sum(graph.edges[a][b][weight] for a, b in zip(path, path[1:]))
+
+
+def test_query_matches_dijkstra():
+    """
+    Test zgodności zapytań z nakładką z algorytmem Dijkstry.
+
+    Sprawdza czy:
+    - Długości ścieżek są równe
+    - Rozwinięta ścieżka jest poprawną ścieżką w grafie o tej długości
+    """
+    graph = random_graph(60, seed=3)
+    partition = partition_graph(graph, cell_size=8)
+    assert len(partition.boundary) > 1
+    for start in range(0, 60, 7):
+        for end in range(0, 60, 5):
+            expected, _ = dijkstra(graph, start, end)
+            distance, path = partition.query(start, end)
+            assert distance == expected
+            if path:
+                assert path[0] == start and path[-1] == end
+                assert _path_cost(graph, path) == distance
+
+
+def test_saved_cells_are_loaded_lazily(tmp_path):
+    """
+    Test zapisu podziału do osobnych plików i leniwego wczytywania komórek.
+    """
+    graph = random_graph(60, seed=3)
+    partition = partition_graph(graph, cell_size=8)
+    partition.save(str(tmp_path))
+    assert len(list(tmp_path.glob("cell_*.json"))) == len(partition.boundary)
+
+    worker = load_partition(str(tmp_path))
+    assert worker.loaded_cells == []
+    distance, _ = worker.query(0, 30)
+    assert distance == dijkstra(graph, 0, 30)[0]
+    assert set(worker.loaded_cells) == {worker.cell_of[0], worker.cell_of[30]}
+
+
+def test_long_route_loads_only_end_cells(tmp_path):
+    """
+    Test zapytania przechodzącego przez wiele komórek.
+
+    Sprawdza czy ścieżka jest rozwijana z nakładki bez wczytywania komórek
+    pośrednich, a wynik jest zgodny z algorytmem Dijkstry.
+    """
+    graph = random_graph(400, "grid", seed=2)
+    partition = partition_graph(graph, cell_size=20)
+    partition.save(str(tmp_path))
+
+    worker = load_partition(str(tmp_path))
+    distance, path = worker.query(0, 399)
+    assert distance == dijkstra(graph, 0, 399)[0]
+    assert path[0] == 0 and path[-1] == 399
+    assert _path_cost(graph, path) == distance
+    assert set(worker.loaded_cells) == {worker.cell_of[0], worker.cell_of[399]}
+    assert len({worker.cell_of[node] for node in path}) > 2
+
+
+def test_overlay_without_clique_paths(tmp_path):
+    """
+    Test wczytywania nakładki zapisanej bez ścieżek klik (starszy format).
+    """
+    graph = random_graph(400, "grid", seed=2)
+    partition_graph(graph, cell_size=20).save(str(tmp_path))
+    overlay_path = tmp_path / "overlay.json"
+    overlay = json.loads(overlay_path.read_text(encoding="utf-8"))
+    overlay["cliques"] = [[cell_id, [edge[:3] for edge in edges]] for cell_id, edges in overlay["cliques"]]
+    overlay_path.write_text(json.dumps(overlay), encoding="utf-8")
+
+    distance, path = load_partition(str(tmp_path)).query(0, 399)
+    assert distance == dijkstra(graph, 0, 399)[0]
+    assert _path_cost(graph, path) == distance
+
+
+def test_customize_only_affected_cell():
+    """
+    Test przeliczania nakładki po zmianie wagi krawędzi.
+
+    Sprawdza czy przeliczana jest tylko komórka zmienionej krawędzi,
+    a wyniki pozostają zgodne z algorytmem Dijkstry.
+    """
+    graph = random_graph(60, seed=3)
+    partition = partition_graph(graph, cell_size=8)
+    cell_edges = partition.cell(0).edges
+    from_node = next(node for node in cell_edges if cell_edges[node])
+    to_node = next(iter(cell_edges[from_node]))
+
+    graph.edges[from_node][to_node]["distance"] = 1000
+    partition.update_edge(from_node, to_node, distance=1000)
+    assert partition.customize() == [0]
+    for end in range(60):
+        assert partition.query(from_node, end)[0] == dijkstra(graph, from_node, end)[0]
+
+
+def test_update_edge_survives_save_and_load(tmp_path):
+    """
+    Test zapisu podziału po zmianie wagi bez jawnego przeliczenia nakładki.
+
+    Sprawdza czy wczytany podział nie korzysta z nieaktualnych klik.
+    """
+    graph = Graph()
+    for node in range(6):
+        graph.add_node(node, "bus_stop", f"Przystanek {node}")
+    for node in range(5):
+        graph.add_edge(node, node + 1, distance=1)
+    partition = partition_graph(graph, cell_size=2)
+
+    graph.edges[2][3]["distance"] = 100
+    partition.update_edge(2, 3, distance=100)
+    partition.save(str(tmp_path))
+
+    worker = load_partition(str(tmp_path))
+    assert worker.query(0, 5) == dijkstra(graph, 0, 5)
+    assert worker.query(0, 5)[0] == 104
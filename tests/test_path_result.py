@@ -0,0 +1,65 @@
+"""
+Moduł testów dla drzewa najkrótszych ścieżek i obiektów wyników.
+
+Ten moduł zawiera testy jednostkowe sprawdzające zbiorcze odtwarzanie
+ścieżek oraz poprawną obsługę identyfikatorów o wartości fałszywej.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph import Graph
+from shortest_path import dijkstra, find_path, shortest_path_tree
+
+
+def _airports():
+    graph = Graph()
+    graph.add_node("WAW", "airport", "Warszawa")
+    graph.add_node("KRK", "airport", "Kraków")
+    graph.add_node("GDN", "airport", "Gdańsk")
+    graph.add_node("POZ", "airport", "Poznań")
+    graph.add_edge("WAW", "KRK", distance=300, time=45)
+    graph.add_edge("WAW", "GDN", distance=350, time=55)
+    graph.add_edge("GDN", "POZ", distance=320, time=50)
+    return graph
+
+
+def test_batch_paths():
+    """
+    Test zbiorczego odtwarzania ścieżek.
+
+    Sprawdza czy:
+    - Ścieżki i sumy atrybutów są poprawne
+    - Nazwy wierzchołków są dostępne na żądanie
+    - Nieosiągalny wierzchołek daje pusty wynik
+    """
+    graph = _airports()
+    graph.add_node("WRO", "airport", "Wrocław")
+    tree = shortest_path_tree(graph, "WAW")
+    poz, krk, wro = tree.paths(["POZ", "KRK", "WRO"])
+
+    assert poz.node_ids() == ["WAW", "GDN", "POZ"]
+    assert poz.names() == ["Warszawa", "Gdańsk", "Poznań"]
+    assert (poz.cost, poz.distance, poz.time) == (670, 670, 105)
+    assert krk.node_ids() == dijkstra(graph, "WAW", "KRK")[1]
+    assert not wro.found
+    assert wro.node_ids() == []
+
+
+def test_falsy_node_ids():
+    """
+    Test identyfikatorów o wartości fałszywej (np. 0).
+
+    Sprawdza czy odtwarzanie ścieżki nie zatrzymuje się na wierzchołku 0.
+    """
+    graph = Graph()
+    for node in (0, 1, 2):
+        graph.add_node(node, "city", f"Miasto {node}")
+    graph.add_edge(2, 0, distance=1)
+    graph.add_edge(0, 1, distance=1)
+
+    assert dijkstra(graph, 2, 1) == (2, [2, 0, 1])
+    assert shortest_path_tree(graph, 2).paths([1])[0].node_ids() == [2, 0, 1]
+    assert find_path({2: None, 0: 2, 1: 0}, 2, 1) == [2, 0, 1]
@@ -50,3 +50,41 @@ def test_dijkstra_no_path():
     distance, path = dijkstra(graph, "A", "B", weight="distance")
     assert distance == float("inf")
     assert path == []
+
+
+def _line_graph():
+    """
+    Tworzy graf A -> B -> C -> D (krawędzie po 1) ze skrótem A -> D (10).
+    """
+    graph = Graph()
+    for node in "ABCD":
+        graph.add_node(node, "bus_stop", f"Przystanek {node}")
+    graph.add_edge("A", "B", distance=1)
+    graph.add_edge("B", "C", distance=1)
+    graph.add_edge("C", "D", distance=1)
+    graph.add_edge("A", "D", distance=10)
+    return graph
+
+
+def test_dijkstra_bounded_search():
+    """
+    Test ograniczeń przeszukiwania.
+
+    Sprawdza czy:
+    - max_cost odcina wierzchołki leżące dalej niż zadany promień
+    - max_hops zwraca najkrótszą ścieżkę o ograniczonej liczbie krawędzi
+    """
+    graph = _line_graph()
+    assert dijkstra(graph, "A", "D", max_cost=2) == (float("inf"), [])
+    assert dijkstra(graph, "A", "D", max_cost=3) == (3, ["A", "B", "C", "D"])
+    assert dijkstra(graph, "A", "D", max_hops=2) == (10, ["A", "D"])
+    assert dijkstra(graph, "A", "C", max_hops=1) == (float("inf"), [])
+
+
+def test_dijkstra_target_set():
+    """
+    Test przeszukiwania do najbliższego z wielu wierzchołków docelowych.
+    """
+    graph = _line_graph()
+    assert dijkstra(graph, "A", targets=["D", "C"]) == (2, ["A", "B", "C"])
+    assert dijkstra(graph, "C", targets={"A", "D"}) == (1, ["C", "D"])
@@ -0,0 +1,80 @@
+"""
+Moduł testów dla indeksu przestrzennego.
+
+Ten moduł zawiera testy jednostkowe porównujące wyniki zapytań
+drzewa k-d z wyszukiwaniem wyczerpującym.
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from graph import Graph
+from spatial_index import KDTree, build_spatial_index
+
+
+def _random_points(count, seed=7):
+    """Generuje losowe punkty o całkowitych współrzędnych (z powtórzeniami)."""
+    rng = random.Random(seed)
+    return {f"N{i}": (rng.randint(0, 50), rng.randint(0, 50)) for i in range(count)}
+
+
+def _sq_dist(point, x, y):
+    return (point[0] - x) ** 2 + (point[1] - y) ** 2
+
+
+def test_nearest_from_graph():
+    """
+    Test wyszukiwania najbliższego wierzchołka grafu.
+
+    Sprawdza czy pomijane są wierzchołki bez współrzędnych.
+    """
+    graph = Graph()
+    graph.add_node("WAW", "airport", "Warszawa", coords=(21.0, 52.2))
+    graph.add_node("KRK", "airport", "Kraków", coords=(19.9, 50.1))
+    graph.add_node("X", "airport", "Bez współrzędnych")
+    index = build_spatial_index(graph)
+    assert len(index) == 2
+    assert index.nearest(20.0, 50.0) == "KRK"
+    assert index.nearest(22.0, 53.0) == "WAW"
+    assert KDTree({}).nearest(0, 0) is None
+
+
+def test_k_nearest_matches_brute_force():
+    """
+    Test k najbliższych wierzchołków.
+
+    Sprawdza czy odległości zwróconych wierzchołków są równe
+    k najmniejszym odległościom wyznaczonym wyczerpująco.
+    """
+    points = _random_points(300)
+    index = KDTree(points)
+    rng = random.Random(1)
+    for _ in range(50):
+        x, y = rng.uniform(-5, 55), rng.uniform(-5, 55)
+        k = rng.randint(1, 10)
+        result = index.k_nearest(x, y, k)
+        expected = sorted(_sq_dist(p, x, y) for p in points.values())[:k]
+        assert [_sq_dist(points[node], x, y) for node in result] == expected
+
+
+def test_within_bbox_matches_brute_force():
+    """
+    Test zapytania o prostokąt.
+
+    Sprawdza czy zwracane są dokładnie wierzchołki leżące w prostokącie
+    (włącznie z punktami na jego brzegu).
+    """
+    points = _random_points(300)
+    index = KDTree(points)
+    rng = random.Random(2)
+    for _ in range(50):
+        min_x, max_x = sorted((rng.randint(0, 50), rng.randint(0, 50)))
+        min_y, max_y = sorted((rng.randint(0, 50), rng.randint(0, 50)))
+        expected = {
+            node for node, (x, y) in points.items()
+            if min_x <= x <= max_x and min_y <= y <= max_y
+        }
+        assert set(index.within_bbox(min_x, min_y, max_x, max_y)) == expected